@@ -4,10 +4,10 @@ The client allows calling different sections of API.
 For example, there's a separate section for authorization,
 and a separate section for IOCean.
 """
-from .api import Null, Nullable, NullType, Tag
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
-from .client import AsyncClient, Client
-from .client_config import Config, Timeouts, Limits
+from .api import Null, Nullable, NullType, Tag
 
 from .enum import CybsiAPIEnum
 
@@ -19,3 +19,43 @@ from .__version__ import (  # noqa: F401
     __title__,
     __version__,
 )
+
+if TYPE_CHECKING:
+    from .client import AsyncClient, Client
+    from .client_config import Config, Timeouts, Limits
+
+# Client and its configuration pull the whole SDK and httpx,
+# so they are imported on first access (PEP 562).
+_LAZY_IMPORTS = {
+    "AsyncClient": ".client",
+    "Client": ".client",
+    "Config": ".client_config",
+    "Limits": ".client_config",
+    "Timeouts": ".client_config",
+}
+
+__all__ = [
+    "AsyncClient",
+    "Client",
+    "Config",
+    "CybsiAPIEnum",
+    "Limits",
+    "Null",
+    "Nullable",
+    "NullType",
+    "Tag",
+    "Timeouts",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -0,0 +1,37 @@
+"""JSON encoding and decoding used by SDK.
+
+`orjson <https://pypi.org/project/orjson/>`_ is used if it's installed,
+standard :mod:`json` module otherwise.
+"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON document."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, *, indent: bool = False) -> str:
+    """Serialize object to JSON document, indented by 2 spaces if requested."""
+    if orjson is not None:
+        # Like standard json, keys of other types than str are allowed.
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def json_encode(obj: Any) -> bytes:
+    """Serialize object to UTF-8 encoded JSON document."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode()
@@ -1,4 +1,4 @@
-from typing import Optional, TypeVar, Union, cast
+from typing import Optional, TypeVar, Union
 
 
 class Tag:
@@ -47,4 +47,5 @@ which are be passed as explicit ``null`` to API.
 
 # SDK internal function. Placed here for locality with Nullable.
 def _unwrap_nullable(value: Nullable[T]) -> Optional[T]:
-    return None if value is Null else cast(T, value)
+    # typing.cast is a real function call at runtime, so it's not used here.
+    return None if value is Null else value  # type: ignore[return-value]
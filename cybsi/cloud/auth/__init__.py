@@ -1,27 +1,68 @@
 """Use this section of API operate auth information.
 """
-from .api import AuthAPI
-from .api_key import (
-    APIKeyAuth,
-    APIKeysAPI,
-    APIKeyRegistrationView,
-    APIKeyForm,
-    APIKeyView,
-)
-from .limits import (
-    RequestLimitForm,
-    RequestLimitTargetView,
-    RequestLimitView,
-    LimitPeriod,
-)
-from .permission import (
-    ResourceAction,
-    ResourcePermissionView,
-    ResourcePermissionForm,
-)
-from .resource import (
-    ResourcesAPI,
-    ResourceView,
-    ResourceRefView,
-)
-from .token import TokenType, TokenView
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .api import AuthAPI
+    from .api_key import (
+        APIKeyAuth,
+        APIKeysAPI,
+        APIKeyRegistrationView,
+        APIKeyForm,
+        APIKeyView,
+    )
+    from .limits import (
+        RequestLimitForm,
+        RequestLimitTargetView,
+        RequestLimitView,
+        LimitPeriod,
+    )
+    from .permission import (
+        ResourceAction,
+        ResourcePermissionView,
+        ResourcePermissionForm,
+    )
+    from .resource import (
+        ResourcesAPI,
+        ResourceView,
+        ResourceRefView,
+    )
+    from .token import TokenType, TokenView
+
+# Submodules are imported on first access (PEP 562).
+_LAZY_IMPORTS = {
+    "AuthAPI": ".api",
+    "APIKeyAuth": ".api_key",
+    "APIKeysAPI": ".api_key",
+    "APIKeyRegistrationView": ".api_key",
+    "APIKeyForm": ".api_key",
+    "APIKeyView": ".api_key",
+    "RequestLimitForm": ".limits",
+    "RequestLimitTargetView": ".limits",
+    "RequestLimitView": ".limits",
+    "LimitPeriod": ".limits",
+    "ResourceAction": ".permission",
+    "ResourcePermissionView": ".permission",
+    "ResourcePermissionForm": ".permission",
+    "ResourcesAPI": ".resource",
+    "ResourceView": ".resource",
+    "ResourceRefView": ".resource",
+    "TokenType": ".token",
+    "TokenView": ".token",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
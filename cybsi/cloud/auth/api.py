@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+from functools import cached_property
+
 from ..internal import BaseAPI
 from .api_key import APIKeysAPI
 from .resource import ResourcesAPI
@@ -6,12 +10,12 @@ from .resource import ResourcesAPI
 class AuthAPI(BaseAPI):
     """Auth API."""
 
-    @property
+    @cached_property
     def api_keys(self) -> APIKeysAPI:
         """API-Keys API handle."""
         return APIKeysAPI(self._connector)
 
-    @property
+    @cached_property
     def resources(self) -> ResourcesAPI:
         """Resources API handle."""
         return ResourcesAPI(self._connector)
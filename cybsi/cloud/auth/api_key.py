@@ -1,14 +1,19 @@
+from __future__ import annotations
+
 import asyncio
-import json
 import logging
 import threading
+import time
 from datetime import datetime
+from functools import cached_property
+from operator import methodcaller
 from typing import AsyncGenerator, Generator, Iterable, List, Optional
 from urllib.parse import urljoin
 
 import httpx
 
-from ..error import _raise_cybsi_error
+from .._json import json_loads
+from ..error import CybsiError, _raise_cybsi_error
 from ..internal import (
     BaseAPI,
     JsonObject,
@@ -20,10 +25,11 @@ from ..internal import (
 from ..pagination import Cursor, Page
 from .limits import RequestLimitForm, RequestLimitView
 from .permission import ResourcePermissionForm, ResourcePermissionView
-from .token import TokenView
 
 logger = logging.getLogger(__name__)
 
+_to_json = methodcaller("json")
+
 
 class APIKeyAuth(httpx.Auth):
     """Automatically handles authentication
@@ -32,82 +38,160 @@ class APIKeyAuth(httpx.Auth):
     Args:
         api_url: Cybsi Cloud auth API URL. Usually equal to Client config API URL.
         api_key: Cybsi Cloud API key.
+        retry_unauthorized: Refresh the token and repeat the request
+            if API rejected a token which is not expired yet
+            (for example, the token was revoked).
+            If disabled, such requests fail with
+            :class:`~cybsi.cloud.error.UnauthorizedError`.
     """
 
     requires_response_body = True  # instructs httpx to pass token request response body
 
     _get_token_path = "/auth/token"
 
-    def __init__(self, *, api_url: str, api_key: str):
+    # Token is refreshed this many seconds before its actual expiration
+    # to avoid sending requests with a token about to expire.
+    _token_expiration_skew = 30.0
+
+    def __init__(self, *, api_url: str, api_key: str, retry_unauthorized: bool = True):
         # See https://www.python-httpx.org/advanced/#customizing-authentication
         self._api_key = api_key
         self._api_url = api_url
-        self._sync_lock = threading.RLock()
-        self._async_lock = asyncio.Lock()
+        self._retry_unauthorized = retry_unauthorized
+        self._token_url = urljoin(api_url, self._get_token_path)
+        self._token_headers = {"X-Api-Key": api_key}
         self._token = ""
+        self._token_expires_at = 0.0  # time.monotonic() based
+        # Requests with a valid token never touch the fields below.
+        # Only one request refreshes the token,
+        # concurrent ones wait for the refresh event.
+        self._sync_lock = threading.Lock()
+        self._sync_refresh: Optional[threading.Event] = None
+        self._async_refresh: Optional[asyncio.Event] = None
+        self._token_client: Optional[httpx.AsyncClient] = None
+
+    def set_token_client(self, client: Optional[httpx.AsyncClient]) -> None:
+        """Send token requests of async clients using the given HTTP client.
+
+        By default, the token is requested using connection pool
+        of the client being authenticated. A separate long-lived client
+        allows several :class:`~cybsi.cloud.AsyncClient` instances
+        to share token endpoint connections.
+
+        The caller owns the client and is responsible for closing it.
+
+        Args:
+            client: HTTP client for token requests.
+                :data:`None` restores the default behavior.
+        """
+        self._token_client = client
 
     def sync_auth_flow(
         self, request: httpx.Request
     ) -> Generator[httpx.Request, httpx.Response, None]:
         token = self._token
-        if token:
-            request.headers["Authorization"] = self._token
+        if token and time.monotonic() < self._token_expires_at:
+            request.headers["Authorization"] = token
             response = yield request
-            if response.status_code != 401:
+            if not self._retry_unauthorized or response.status_code != 401:
                 return
 
-        with self._sync_lock:
-            if self._token == token:
+        # Waiters repeat the refresh themselves if the refresher failed
+        # and the token is unchanged.
+        while True:
+            with self._sync_lock:
+                if self._token != token:
+                    break
+                refresh = self._sync_refresh
+                owner = refresh is None
+                if refresh is None:
+                    refresh = self._sync_refresh = threading.Event()
+
+            if not owner:
+                refresh.wait()
+                continue
+
+            try:
                 token_response = yield self._build_token_request(request)
-                self._update_token(token_response, token_response.read())
-            request.headers["Authorization"] = self._token
-            yield request
+                self._update_token(token_response)
+            finally:
+                with self._sync_lock:
+                    self._sync_refresh = None
+                refresh.set()
+            break
+
+        request.headers["Authorization"] = self._token
+        yield request
 
     async def async_auth_flow(
         self, request: httpx.Request
     ) -> AsyncGenerator[httpx.Request, httpx.Response]:
         token = self._token
-        if token:
-            request.headers["Authorization"] = self._token
+        if token and time.monotonic() < self._token_expires_at:
+            request.headers["Authorization"] = token
             response = yield request
-            if response.status_code != 401:
+            if not self._retry_unauthorized or response.status_code != 401:
                 return
 
-        async with self._async_lock:
-            if self._token == token:
-                token_response = yield self._build_token_request(request)
-                self._update_token(token_response, await token_response.aread())
-            request.headers["Authorization"] = self._token
-            yield request
+        # There are no awaits between the check and the assignment,
+        # so the event loop guarantees only one refresher.
+        # Waiters repeat the refresh themselves if the refresher failed
+        # and the token is unchanged.
+        while self._token == token:
+            refresh = self._async_refresh
+            if refresh is not None:
+                await refresh.wait()
+                continue
+
+            refresh = self._async_refresh = asyncio.Event()
+            try:
+                token_request = self._build_token_request(request)
+                if self._token_client is not None:
+                    token_response = await self._token_client.send(token_request)
+                else:
+                    token_response = yield token_request
+                self._update_token(token_response)
+            finally:
+                self._async_refresh = None
+                refresh.set()
+            break
+
+        request.headers["Authorization"] = self._token
+        yield request
 
     def _build_token_request(self, req) -> httpx.Request:
-        token_url = urljoin(self._api_url, self._get_token_path)
-        headers = {
-            "X-Api-Version": req.headers["X-Api-Version"],
-            "User-Agent": req.headers["User-Agent"],
-            "X-Api-Key": self._api_key,
-        }
+        headers = self._token_headers.copy()
+        headers["X-Api-Version"] = req.headers["X-Api-Version"]
+        headers["User-Agent"] = req.headers["User-Agent"]
         return httpx.Request(
             "GET",
-            url=token_url,
+            url=self._token_url,
             headers=headers,
             extensions=req.extensions,
         )
 
-    def _update_token(
-        self, token_response: httpx.Response, token_response_content: bytes
-    ) -> None:
-        if not token_response.is_success:
-            _raise_cybsi_error(token_response)
-        token = TokenView(json.loads(token_response_content))
+    def _update_token(self, token_response: httpx.Response) -> None:
+        # The body is already read by httpx, see requires_response_body.
+        _raise_cybsi_error(token_response)
+        # Read token fields directly, TokenView is not needed for two fields.
+        data = json_loads(token_response.content)
+        try:
+            token = f"{data['tokenType']} {data['accessToken']}"
+            lifetime = int(data["expiresIn"])
+        except (KeyError, TypeError, ValueError) as exp:
+            raise CybsiError("invalid token response", exp) from exp
 
-        self._token = f"{token.type.value} {token.access_token}"
+        skew = min(self._token_expiration_skew, lifetime / 2)
+        # Keep the header value as str: httpx.Headers doesn't accept bytes values.
+        self._token = token
+        self._token_expires_at = time.monotonic() + lifetime - skew
 
 
 class APIKeysAPI(BaseAPI):
     """API-Keys API."""
 
     _path = "/auth/keys"
+    _cache_ttl = 5.0  # keys can be revoked by another client
 
     def filter(
         self,
@@ -116,6 +200,7 @@ class APIKeysAPI(BaseAPI):
         description: Optional[str] = None,
         cursor: Optional[Cursor] = None,
         limit: Optional[int] = None,
+        prefetch: bool = False,
     ) -> Page["APIKeyView"]:
         """Get API keys.
 
@@ -126,6 +211,9 @@ class APIKeysAPI(BaseAPI):
             description: Key description.
             cursor: Page cursor.
             limit: Page limit.
+            prefetch: Request the next page in background
+                while the current one is processed.
+                See :class:`~cybsi.cloud.pagination.Page`.
         Return:
             Page with API-Key common views and next page cursor.
         Raises:
@@ -141,8 +229,10 @@ class APIKeysAPI(BaseAPI):
             params["revoked"] = bool(revoked)
         if description is not None:
             params["description"] = str(description)
-        resp = self._connector.do_get(path=self._path, params=params)
-        page = Page(self._connector.do_get, resp, APIKeyView)
+        resp = self._connector.do_get(
+            path=self._path, params=params, cache_ttl=self._cache_ttl
+        )
+        page = Page(self._connector.do_get, resp, APIKeyView, prefetch=prefetch)
         return page
 
     def generate(self, api_key: "APIKeyForm") -> "APIKeyRegistrationView":
@@ -163,8 +253,12 @@ class APIKeysAPI(BaseAPI):
               * :attr:`~cybsi.cloud.error.SemanticErrorCodes.ResourceNotFound`
         """
 
-        resp = self._connector.do_post(path=self._path, json=api_key.json())
-        return APIKeyRegistrationView(resp.json())
+        resp = self._connector.do_post(
+            path=self._path,
+            content=api_key.serialized_json(),
+            headers={"Content-Type": "application/json"},
+        )
+        return APIKeyRegistrationView(json_loads(resp.content))
 
     def revoke(
         self,
@@ -215,8 +309,8 @@ class APIKeyForm(JsonObjectForm):
         if description is not None:
             self._data["description"] = description
         if request_limits is not None:
-            self._data["requestLimits"] = [limit.json() for limit in request_limits]
-        self._data["permissions"] = [perm.json() for perm in permissions]
+            self._data["requestLimits"] = list(map(_to_json, request_limits))
+        self._data["permissions"] = list(map(_to_json, permissions))
 
 
 class APIKeyRegistrationView(JsonObjectView):
@@ -244,12 +338,12 @@ class APIKeyView(JsonObjectView):
         """API-Key identifier."""
         return self._get("id")
 
-    @property
+    @cached_property
     def created_at(self) -> datetime:
         """Creation date."""
         return parse_rfc3339_timestamp(self._get("createdAt"))
 
-    @property
+    @cached_property
     def expires_at(self) -> Optional[datetime]:
         """Expiration date.
         The API-Key is automatically disabled after the expiration date."""
@@ -260,7 +354,7 @@ class APIKeyView(JsonObjectView):
         """API-Key description."""
         return self._get_optional("description")
 
-    @property
+    @cached_property
     def last_used_at(self) -> Optional[datetime]:
         """Last usage date."""
         return self._map_optional("lastUsedAt", parse_rfc3339_timestamp)
@@ -270,12 +364,12 @@ class APIKeyView(JsonObjectView):
         """API-Key revoked flag."""
         return self._get("revoked")
 
-    @property
+    @cached_property
     def permissions(self) -> List[ResourcePermissionView]:
         """List of permissions."""
-        return [ResourcePermissionView(perm) for perm in self._get("permissions")]
+        return list(map(ResourcePermissionView, self._get("permissions")))
 
-    @property
+    @cached_property
     def request_limits(self) -> List[RequestLimitView]:
         """List of request limits."""
-        return [RequestLimitView(limit) for limit in self._get("requestLimits")]
+        return list(map(RequestLimitView, self._get("requestLimits")))
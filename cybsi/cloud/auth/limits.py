@@ -1,6 +1,6 @@
-from enum_tools import document_enum
+from __future__ import annotations
 
-from ..enum import CybsiAPIEnum
+from ..enum import CybsiAPIEnum, document_enum
 from ..internal import JsonObjectForm, JsonObjectView
 from .permission import ResourceAction
 from .resource import ResourceRefView
@@ -1,11 +1,15 @@
-from typing import Iterable, List
+from __future__ import annotations
 
-from enum_tools import document_enum
+from functools import cached_property
+from operator import attrgetter
+from typing import Iterable, List
 
-from ..enum import CybsiAPIEnum
+from ..enum import CybsiAPIEnum, document_enum
 from ..internal import JsonObjectForm, JsonObjectView
 from .resource import ResourceRefView
 
+_get_value = attrgetter("value")
+
 
 @document_enum
 class ResourceAction(CybsiAPIEnum):
@@ -29,10 +33,10 @@ class ResourcePermissionView(JsonObjectView):
         """Resource."""
         return ResourceRefView(self._get("resource"))
 
-    @property
+    @cached_property
     def actions(self) -> List[ResourceAction]:
         """List of permitted actions."""
-        return [ResourceAction(act) for act in self._get("actions")]
+        return list(map(ResourceAction, self._get("actions")))
 
 
 class ResourcePermissionForm(JsonObjectForm):
@@ -53,4 +57,4 @@ class ResourcePermissionForm(JsonObjectForm):
     ):
         super().__init__()
         self._data["resource"] = {"id": resource_id}
-        self._data["actions"] = [act.value for act in actions]
+        self._data["actions"] = list(map(_get_value, actions))
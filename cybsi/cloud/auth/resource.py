@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from typing import Optional
 
 from ..error import JsonObject
@@ -9,6 +11,7 @@ class ResourcesAPI(BaseAPI):
     """Resources API."""
 
     _path = "/auth/resources"
+    _cache_ttl = 60.0  # resources are almost static
 
     def filter(
         self,
@@ -16,6 +19,7 @@ class ResourcesAPI(BaseAPI):
         parent_id: Optional[int] = None,
         cursor: Optional[Cursor] = None,
         limit: Optional[int] = None,
+        prefetch: bool = False,
     ) -> Page["ResourceView"]:
         """Get resources.
 
@@ -25,6 +29,9 @@ class ResourcesAPI(BaseAPI):
             parent_id: identifier of parent resource. It must be greater than 0.
             cursor: Page cursor.
             limit: Page limit.
+            prefetch: Request the next page in background
+                while the current one is processed.
+                See :class:`~cybsi.cloud.pagination.Page`.
         Return:
             Page with resource common views and next page cursor.
         Raises:
@@ -42,8 +49,10 @@ class ResourcesAPI(BaseAPI):
             params["cursor"] = str(cursor)
         if limit is not None:
             params["limit"] = limit
-        resp = self._connector.do_get(path=self._path, params=params)
-        page = Page(self._connector.do_get, resp, ResourceView)
+        resp = self._connector.do_get(
+            path=self._path, params=params, cache_ttl=self._cache_ttl
+        )
+        page = Page(self._connector.do_get, resp, ResourceView, prefetch=prefetch)
         return page
 
 
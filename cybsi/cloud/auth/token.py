@@ -1,8 +1,8 @@
-import datetime
+from __future__ import annotations
 
-from enum_tools import document_enum
+import datetime
 
-from cybsi.cloud.enum import CybsiAPIEnum
+from cybsi.cloud.enum import CybsiAPIEnum, document_enum
 
 from ..internal import JsonObjectView
 
@@ -1,3 +1,12 @@
+from __future__ import annotations
+
+import asyncio
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
 from .auth import APIKeyAuth, AuthAPI
 from .client_config import Config
 from .files import FilesAPI, FilesAsyncAPI
@@ -5,6 +14,32 @@ from .insight.api import InsightAPI, InsightAsyncAPI
 from .internal import AsyncHTTPConnector, HTTPConnector
 from .iocean import IOCeanAPI, IOCeanAsyncAPI
 
+T = TypeVar("T")
+
+# Connectors of clients created by Client.shared_pool.
+# They are kept open between clients until Client.close_shared_pools call.
+_shared_connectors: Dict[Tuple, HTTPConnector] = {}
+_shared_connectors_lock = threading.Lock()
+
+
+def _shared_connector_key(config: Config) -> Tuple:
+    timeouts, limits = config.timeouts, config.limits
+    return (
+        config.api_url,
+        config.api_key,
+        config.ssl_verify,
+        (timeouts.connect, timeouts.read, timeouts.write),
+        (
+            limits.max_connections,
+            limits.max_keepalive_connections,
+            limits.keepalive_expiry,
+        ),
+        config.retry,
+        config.cache_enabled,
+        config.cache_stale_on_error,
+        config.http2,
+    )
+
 
 class Client:
     """The main entry point for all actions with Cybsi Cloud REST API.
@@ -31,6 +66,10 @@ class Client:
 
     Args:
         config: Client config.
+        auth: API key authentication shared with other clients.
+            By default, the client creates its own one.
+            Clients sharing the same instance share the access token,
+            so the token is obtained once for all of them.
     Usage:
         >>> from cybsi.cloud import Config, Client
         >>> api_key = "8Nqjk6V4Q_et_Rf5EPu4SeWy4nKbVPKPzKJESYdRd7E"
@@ -40,10 +79,24 @@ class Client:
         >>> collections = client.iocean.collections.filter()
         >>> print(collections.data())
         >>> client.close()  # "with" syntax is also supported for Client
+
+        Share access token between synchronous and asynchronous clients:
+
+        >>> from cybsi.cloud import AsyncClient
+        >>> from cybsi.cloud.auth import APIKeyAuth
+        >>> auth = APIKeyAuth(api_url=config.api_url, api_key=config.api_key)
+        >>> client = Client(config, auth=auth)
+        >>> async_client = AsyncClient(config, auth=auth)
+
+        Reuse connections of clients created in short-lived contexts:
+
+        >>> with Client.shared_pool(config) as client:
+        >>>     collections = client.iocean.collections.filter()
     """
 
-    def __init__(self, config: Config):
-        auth = APIKeyAuth(api_url=config.api_url, api_key=config.api_key)
+    def __init__(self, config: Config, *, auth: Optional[APIKeyAuth] = None):
+        if auth is None:
+            auth = APIKeyAuth(api_url=config.api_url, api_key=config.api_key)
 
         self._connector = HTTPConnector(
             base_url=config.api_url,
@@ -52,10 +105,61 @@ class Client:
             timeouts=config.timeouts,
             limits=config.limits,
             retry=config.retry,
+            cache_enabled=config.cache_enabled,
+            cache_stale_on_error=config.cache_stale_on_error,
+            http2=config.http2,
         )
+        self._shared_key: Optional[Tuple] = None
+        self._batch_workers = config.limits.max_connections
+
+    @classmethod
+    def shared_pool(cls, config: Config) -> "Client":
+        """Get client sharing connection pool with other clients of the same config.
+
+        Clients created by this method with equal configs
+        share HTTP connections and access token.
+        Closing the client doesn't close the pool, it's kept open
+        for clients created later. Pools are closed
+        by :meth:`close_shared_pools` or on interpreter exit.
+
+        Use it if clients are created and closed frequently,
+        for example, one client per web request.
+        It saves TCP and TLS handshakes on each new client.
+
+        Args:
+            config: Client config.
+        Return:
+            Client sharing connection pool.
+        """
+        key = _shared_connector_key(config)
+        with _shared_connectors_lock:
+            connector = _shared_connectors.get(key)
+            if connector is None:
+                client = cls(config)
+                _shared_connectors[key] = client._connector
+            else:
+                client = cls.__new__(cls)
+                client._connector = connector
+                client._batch_workers = config.limits.max_connections
+            client._shared_key = key
+        return client
+
+    @staticmethod
+    def close_shared_pools() -> None:
+        """Close connection pools of clients created by :meth:`shared_pool`.
+
+        Clients using the pools must not be used after the call.
+        Clients created by :meth:`shared_pool` later open new pools.
+        """
+        with _shared_connectors_lock:
+            connectors = list(_shared_connectors.values())
+            _shared_connectors.clear()
+        for connector in connectors:
+            connector.close()
 
     def __enter__(self) -> "Client":
-        self._connector.__enter__()
+        if self._shared_key is None:
+            self._connector.__enter__()
         return self
 
     def __exit__(
@@ -64,33 +168,81 @@ class Client:
         exc_value=None,
         traceback=None,
     ) -> None:
-        self._connector.__exit__(exc_type, exc_value, traceback)
+        if self._shared_key is None:
+            self._connector.__exit__(exc_type, exc_value, traceback)
+        else:
+            self.close()
 
     def close(self) -> None:
-        """Close client and release connections."""
-        self._connector.close()
+        """Close client and release connections.
+
+        Connections of a client created by :meth:`shared_pool`
+        stay open for other clients.
+        """
+        if self._shared_key is None:
+            self._connector.close()
+
+    def batch(
+        self, calls: Iterable[Callable[[], T]], *, max_workers: Optional[int] = None
+    ) -> List[T]:
+        """Execute client calls concurrently.
+
+        Calls share the client connection pool. Enable HTTP/2 in config
+        to multiplex them over a single connection.
 
-    @property
+        Args:
+            calls: Functions making requests using the client.
+            max_workers: Maximum number of calls executed at once.
+                By default, it's `max_connections` of config limits,
+                so that each call can have its own connection.
+                If the limit isn't set, the number is chosen by
+                :class:`~concurrent.futures.ThreadPoolExecutor`.
+        Return:
+            Results of calls in the same order.
+        Raises:
+            Exception of the first failed call (in calls order).
+            Calls not started yet are cancelled.
+        Usage:
+            >>> from functools import partial
+            >>> collections = client.batch(
+            >>>     partial(client.iocean.collections.view, collection_id)
+            >>>     for collection_id in collection_ids
+            >>> )
+        """
+        if max_workers is None:
+            max_workers = self._batch_workers
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(call) for call in calls]
+            try:
+                return [future.result() for future in futures]
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    @cached_property
     def auth(self) -> AuthAPI:
         """Auth API handle."""
         return AuthAPI(self._connector)
 
-    @property
+    @cached_property
     def iocean(self) -> IOCeanAPI:
         """IOCean API handle."""
         return IOCeanAPI(self._connector)
 
-    @property
+    @cached_property
     def insight(self) -> InsightAPI:
         """Insight API handle."""
         return InsightAPI(self._connector)
 
-    @property
+    @cached_property
     def files(self) -> FilesAPI:
         """Files API handle."""
         return FilesAPI(self._connector)
 
 
+atexit.register(Client.close_shared_pools)
+
+
 class AsyncClient:
     """The asynchronous analog of :class:`Client`.
 
@@ -100,10 +252,13 @@ class AsyncClient:
 
     Args:
         config: Client config.
+        auth: API key authentication shared with other clients.
+            See :class:`Client` for details.
     """
 
-    def __init__(self, config: Config):
-        auth = APIKeyAuth(api_url=config.api_url, api_key=config.api_key)
+    def __init__(self, config: Config, *, auth: Optional[APIKeyAuth] = None):
+        if auth is None:
+            auth = APIKeyAuth(api_url=config.api_url, api_key=config.api_key)
 
         self._connector = AsyncHTTPConnector(
             base_url=config.api_url,
@@ -112,6 +267,7 @@ class AsyncClient:
             timeouts=config.timeouts,
             limits=config.limits,
             retry=config.retry,
+            http2=config.http2,
         )
 
     async def __aenter__(self) -> "AsyncClient":
@@ -130,17 +286,45 @@ class AsyncClient:
         """Close client and release connections."""
         await self._connector.aclose()
 
-    @property
+    async def batch(self, calls: Iterable[Awaitable[T]]) -> List[T]:
+        """Execute client calls concurrently.
+
+        Calls share the client connection pool. Enable HTTP/2 in config
+        to multiplex them over a single connection.
+
+        Args:
+            calls: Coroutines making requests using the client.
+        Return:
+            Results of calls in the same order.
+        Raises:
+            Exception of the first failed call.
+            Other calls are cancelled.
+        Usage:
+            >>> collections = await client.batch(
+            >>>     client.iocean.collections.view(collection_id)
+            >>>     for collection_id in collection_ids
+            >>> )
+        """
+        tasks = [asyncio.ensure_future(call) for call in calls]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    @cached_property
     def iocean(self) -> IOCeanAsyncAPI:
         """IOCean asynchronous API handle."""
         return IOCeanAsyncAPI(self._connector)
 
-    @property
+    @cached_property
     def insight(self) -> InsightAsyncAPI:
         """Insight asynchronous API handle."""
         return InsightAsyncAPI(self._connector)
 
-    @property
+    @cached_property
     def files(self) -> FilesAsyncAPI:
         """Files API handle."""
         return FilesAsyncAPI(self._connector)
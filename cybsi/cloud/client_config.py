@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Optional, Union
 
 import httpx
@@ -23,6 +24,8 @@ class Limits:
             a keep-alive connection.
     """
 
+    __slots__ = ("max_connections", "max_keepalive_connections", "keepalive_expiry")
+
     def __init__(
         self,
         *,
@@ -35,6 +38,11 @@ class Limits:
         self.keepalive_expiry = keepalive_expiry
 
     def _as_httpx_limits(self) -> httpx.Limits:
+        if self is _DEFAULT_LIMITS:
+            return _default_httpx_limits()
+        return self._make_httpx_limits()
+
+    def _make_httpx_limits(self) -> httpx.Limits:
         return httpx.Limits(
             max_connections=self.max_connections,
             max_keepalive_connections=self.max_keepalive_connections,
@@ -76,6 +84,8 @@ class Timeouts:
         >>> Timeouts(default=5.0, connect=10.0)
     """
 
+    __slots__ = ("connect", "read", "write")
+
     def __init__(
         self,
         *,
@@ -89,33 +99,28 @@ class Timeouts:
             assert connect is Null
             assert read is Null
             assert write is Null
-            self.connect = _unwrap_nullable(default.connect)  # type: Optional[float]
-            self.read = _unwrap_nullable(default.read)  # type: Optional[float]
-            self.write = _unwrap_nullable(default.write)  # type: Optional[float]
-
-        elif not (connect is Null or read is Null or write is Null):
-            self.connect = _unwrap_nullable(connect)
-            self.read = _unwrap_nullable(read)
-            self.write = _unwrap_nullable(write)
-        else:
-            if default is Null:
-                raise ValueError(
-                    "Timeout must either include default settings "
-                    "for all operations or set all three parameters explicitly."
-                )
-            self.connect = (
-                _unwrap_nullable(default)
-                if connect is Null
-                else _unwrap_nullable(connect)
-            )
-            self.read = (
-                _unwrap_nullable(default) if read is Null else _unwrap_nullable(read)
-            )
-            self.write = (
-                _unwrap_nullable(default) if write is Null else _unwrap_nullable(write)
+            self.connect = default.connect  # type: Optional[float]
+            self.read = default.read  # type: Optional[float]
+            self.write = default.write  # type: Optional[float]
+            return
+
+        if default is Null and (connect is Null or read is Null or write is Null):
+            raise ValueError(
+                "Timeout must either include default settings "
+                "for all operations or set all three parameters explicitly."
             )
 
+        timeout = _unwrap_nullable(default)
+        self.connect = timeout if connect is Null else _unwrap_nullable(connect)
+        self.read = timeout if read is Null else _unwrap_nullable(read)
+        self.write = timeout if write is Null else _unwrap_nullable(write)
+
     def _as_httpx_timeouts(self) -> httpx.Timeout:
+        if self is _DEFAULT_TIMEOUTS:
+            return _default_httpx_timeouts()
+        return self._make_httpx_timeouts()
+
+    def _make_httpx_timeouts(self) -> httpx.Timeout:
         return httpx.Timeout(
             connect=self.connect,
             read=self.read,
@@ -126,9 +131,20 @@ class Timeouts:
         )
 
 
-_DEFAULT_TIMEOUTS = Timeouts(default=60.0)
+_DEFAULT_TIMEOUTS = Timeouts(default=60.0, connect=10.0)
 _DEFAULT_RETRY_COUNT = 3
-_DEFAULT_LIMITS = Limits(max_connections=100, max_keepalive_connections=20)
+_DEFAULT_LIMITS = Limits(max_connections=256, max_keepalive_connections=64)
+
+
+# httpx settings for default configuration are shared by all clients.
+@lru_cache(maxsize=None)
+def _default_httpx_timeouts() -> httpx.Timeout:
+    return _DEFAULT_TIMEOUTS._make_httpx_timeouts()
+
+
+@lru_cache(maxsize=None)
+def _default_httpx_limits() -> httpx.Limits:
+    return _DEFAULT_LIMITS._make_httpx_limits()
 
 
 class Config:
@@ -138,14 +154,35 @@ class Config:
         api_key: Cybsi Cloud API key.
         api_url: Base API URL.
         ssl_verify: Enable SSL certificate verification.
-        timeouts: Timeout configuration. Default configuration is 60 sec
-            on all operations.
+        timeouts: Timeout configuration. Default configuration is 10 sec
+            on connect and 60 sec on other operations.
         limits:  Configuration for limits to various client behaviors.
-            Default configuration is max_connections=100, max_keepalive_connections=20.
+            Default configuration is max_connections=256, max_keepalive_connections=64.
         retry: The count of sending request attempts
             if a connection or transport error occurred.
+        cache_enabled: Enable in-memory caching of rarely changing API responses,
+            like auth resources and API keys lists.
+            Any modifying request made by the client invalidates the cache.
+        cache_stale_on_error: Serve an expired cached response
+            if API is unavailable.
+            Has effect only if caching is enabled.
+        http2: Enable HTTP/2 support. Concurrent requests of the client are
+            multiplexed over a single connection if server supports HTTP/2.
+            Requires `h2` package, install SDK with ``httpx[http2]``.
     """
 
+    __slots__ = (
+        "api_key",
+        "api_url",
+        "ssl_verify",
+        "timeouts",
+        "limits",
+        "retry",
+        "cache_enabled",
+        "cache_stale_on_error",
+        "http2",
+    )
+
     def __init__(
         self,
         *,
@@ -155,6 +192,9 @@ class Config:
         timeouts: Timeouts = _DEFAULT_TIMEOUTS,
         limits: Limits = _DEFAULT_LIMITS,
         retry: int = _DEFAULT_RETRY_COUNT,
+        cache_enabled: bool = False,
+        cache_stale_on_error: bool = False,
+        http2: bool = False,
     ):
         self.api_key = api_key
         self.api_url = api_url
@@ -162,3 +202,6 @@ class Config:
         self.timeouts = timeouts
         self.limits = limits
         self.retry = retry if retry > 0 else 0
+        self.cache_enabled = cache_enabled
+        self.cache_stale_on_error = cache_stale_on_error
+        self.http2 = http2
@@ -1,15 +1,23 @@
-from enum import Enum
+import sys
+from enum import Enum, EnumMeta
 from functools import lru_cache
-from typing import TypeVar
+from typing import Dict, TypeVar
 
 ET = TypeVar("ET")
+EnumType = TypeVar("EnumType", bound=EnumMeta)
 
 
 class CybsiAPIEnum(Enum):
     """CybsiAPIEnum is a base class for all Cybsi Cloud API enumerations."""
 
+    # Plain attribute copy of the value. Enum value is a property,
+    # which is slow to get in request builders called at high rate.
+    _v: str
+
+    def __init__(self, *args) -> None:
+        self._v = self._value_
+
     @classmethod
-    @lru_cache()
     def from_string(cls, value: str, ignore_case=False):
         """Convert a string value to enumeration value.
 
@@ -19,14 +27,36 @@ class CybsiAPIEnum(Enum):
         Return:
             Enumeration value.
         """
-        try:
-            return cls(value)
-        except ValueError as exp:
-            if not ignore_case:
-                raise exp from None
+        member = cls._value2member_map_.get(value)
+        if member is not None:
+            return member
+
+        if ignore_case:
+            member = _lower_value_map(cls).get(value.lower())
+            if member is not None:
+                return member
+
+        return cls(value)  # raises ValueError
+
+
+@lru_cache(maxsize=None)
+def _lower_value_map(enum_cls) -> Dict[str, Enum]:
+    # Enumeration members are immutable, so the map is built once per class.
+    return {str(member.value).lower(): member for member in enum_cls}
+
+
+def document_enum(an_enum: EnumType) -> EnumType:
+    """Document enumeration members using their docstrings.
+
+    Wraps :func:`enum_tools.documentation.document_enum`,
+    which does nothing unless docs are being built
+    or Python runs interactively. Heavy enum_tools import
+    is skipped in other cases.
+    """
+    loaded = "enum_tools.documentation" in sys.modules
+    if not loaded and not getattr(sys, "ps1", sys.flags.interactive):
+        return an_enum
 
-            for member in cls:
-                if str(member.value).lower() == value.lower():
-                    return member
+    from enum_tools import documentation
 
-            raise exp from None
+    return documentation.document_enum(an_enum)
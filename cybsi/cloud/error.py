@@ -9,12 +9,12 @@ Each exception type is annotated if it makes sense to retry.
 
 Some exceptions have ``code`` property. It allows to determine the concrete error.
 """
-from typing import Any, Dict, Optional, cast
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import httpx
-from enum_tools import document_enum
 
-from .enum import CybsiAPIEnum
+from ._json import json_loads
+from .enum import CybsiAPIEnum, document_enum
 
 
 class CybsiError(Exception):
@@ -30,6 +30,8 @@ class CybsiError(Exception):
 
     """
 
+    __slots__ = ("_ex",)
+
     def __init__(self, message: str, ex: Optional[Exception] = None):
         if ex and str(ex) != "":
             message = f"{message}: {ex}"
@@ -40,36 +42,48 @@ class CybsiError(Exception):
 JsonObject = Dict[str, Any]
 
 
+def _parse_body(resp: httpx.Response) -> JsonObject:
+    # Error responses can have empty body.
+    return json_loads(resp.content) if resp.content else {}
+
+
 class APIError(CybsiError):
     """Base exception for HTTP 4xx API responses."""
 
+    __slots__ = ("_status", "_resp", "_view")
+
     def __init__(
         self,
         status: int,
-        content: JsonObject,
+        content: Optional[JsonObject],
         header: Optional[str] = None,
         suffix: Optional[str] = None,
+        resp: Optional[httpx.Response] = None,
     ) -> None:
         self._status = status
-        self._view = ErrorView(content)
-        self._header = (
-            header
-            if header is not None
-            else f"API response error. HTTP status: {self._status}"
-        )
-        self._suffix = (
-            suffix
-            if suffix is not None
-            else f"code: {self._view.code}, message: {self._view.message}"
-        )
-
-        msg = self._header
-        if self._suffix:
-            msg += f", {self._suffix}"
+        # Content can be omitted if the message doesn't include it.
+        # It's parsed from the response on first access then.
+        self._resp = resp
+        self._view = ErrorView(content) if content is not None else None
+        if header is None:
+            header = f"API response error. HTTP status: {status}"
+        if suffix is None:
+            view = self.content
+            suffix = f"code: {view.code}, message: {view.message}"
+
+        msg = f"{header}, {suffix}" if suffix else header
         super().__init__(msg)
 
     @property
     def content(self) -> "ErrorView":
+        if self._view is None:
+            content: JsonObject = {}
+            if self._resp is not None:
+                try:
+                    content = _parse_body(self._resp)
+                except ValueError:
+                    pass
+            self._view = ErrorView(content)
         return self._view
 
 
@@ -84,39 +98,47 @@ class InvalidRequestError(APIError):
 
     """
 
+    __slots__ = ()
+
     BadRequest = "BadRequest"
     InvalidData = "InvalidData"
     InvalidPathArgument = "InvalidPathArgument"
     InvalidQueryArgument = "InvalidQueryArgument"
 
     def __init__(self, resp: httpx.Response) -> None:
-        super().__init__(400, resp.json(), header="invalid request")
+        super().__init__(400, _parse_body(resp), header="invalid request")
 
 
 class UnauthorizedError(APIError):
     """Client lacks valid authentication credentials. Retry will never work."""
 
+    __slots__ = ()
+
     Unauthorized = "Unauthorized"
 
     def __init__(self, resp: httpx.Response) -> None:
-        super().__init__(401, resp.json(), header="operation not authorized")
+        super().__init__(401, _parse_body(resp), header="operation not authorized")
 
 
 class ForbiddenError(APIError):
     """Operation was forbidden. Retry will not work unless system is reconfigured."""
 
+    __slots__ = ()
+
     def __init__(self, resp: httpx.Response) -> None:
-        super().__init__(403, resp.json(), header="operation forbidden")
+        super().__init__(403, _parse_body(resp), header="operation forbidden")
 
     @property
     def code(self) -> "ForbiddenErrorCodes":
         """Error code."""
-        return ForbiddenErrorCodes(self._view.code)
+        return ForbiddenErrorCodes(self.content.code)
 
 
 class NotFoundError(APIError):
     """Requested resource not found. Retry will never work."""
 
+    __slots__ = ()
+
     def __init__(self, resp: httpx.Response) -> None:
         super().__init__(404, {}, header="resource not found", suffix="")
 
@@ -124,13 +146,15 @@ class NotFoundError(APIError):
 class ConflictError(APIError):
     """Resource already exists. Retry will never work."""
 
+    __slots__ = ()
+
     def __init__(self, resp: httpx.Response) -> None:
-        super().__init__(409, resp.json(), header="resource already exists")
+        super().__init__(409, _parse_body(resp), header="resource already exists")
 
     @property
     def code(self) -> "ConflictErrorCodes":
         """Error code."""
-        return ConflictErrorCodes(self._view.code)
+        return ConflictErrorCodes(self.content.code)
 
 
 class ResourceModifiedError(APIError):
@@ -139,24 +163,38 @@ class ResourceModifiedError(APIError):
     Read the updated resource from API, and apply your modifications again.
     """
 
+    __slots__ = ()
+
     def __init__(self, resp: httpx.Response) -> None:
         super().__init__(
-            412, resp.json(), header="resource was modified since last read", suffix=""
+            412,
+            None,
+            header="resource was modified since last read",
+            suffix="",
+            resp=resp,
         )
 
 
 class RequestEntityTooLargeError(APIError):
     """Request content is too large."""
 
+    __slots__ = ()
+
     def __init__(self, resp: httpx.Response) -> None:
         super().__init__(
-            413, resp.json(), header="request content is too large", suffix=""
+            413, None, header="request content is too large", suffix="", resp=resp
         )
 
 
 class RangeNotSatisfiableError(APIError):
-    def __init__(self, content: JsonObject) -> None:
-        super().__init__(416, content, header="range is not satisfiable", suffix="")
+    """Requested range is not satisfiable. Retry will never work."""
+
+    __slots__ = ()
+
+    def __init__(self, resp: httpx.Response) -> None:
+        super().__init__(
+            416, None, header="range is not satisfiable", suffix="", resp=resp
+        )
 
 
 class SemanticError(APIError):
@@ -167,13 +205,15 @@ class SemanticError(APIError):
     For example, we're trying to unpack an artifact, but the artifact is not an archive.
     """
 
+    __slots__ = ()
+
     def __init__(self, resp: httpx.Response) -> None:
-        super().__init__(422, resp.json(), header="semantic error")
+        super().__init__(422, _parse_body(resp), header="semantic error")
 
     @property
     def code(self) -> "SemanticErrorCodes":
         """Error code."""
-        return SemanticErrorCodes(self._view.code)
+        return SemanticErrorCodes(self.content.code)
 
 
 class TooManyRequestsError(APIError):
@@ -182,15 +222,17 @@ class TooManyRequestsError(APIError):
     Retry request after some time.
     """
 
+    __slots__ = ("_retry_after",)
+
     def __init__(self, resp: httpx.Response) -> None:
-        super().__init__(429, resp.json(), header="too many requests error")
+        super().__init__(429, _parse_body(resp), header="too many requests error")
         retry_after = resp.headers.get("Retry-After")
         self._retry_after = int(retry_after) if retry_after is not None else None
 
     @property
     def code(self) -> "TooManyRequestsErrorCodes":
         """Error code."""
-        return TooManyRequestsErrorCodes(self._view.code)
+        return TooManyRequestsErrorCodes(self.content.code)
 
     @property
     def retry_after(self) -> Optional[int]:
@@ -268,48 +310,62 @@ class TooManyRequestsErrorCodes(CybsiAPIEnum):
     """Request limit exceeded."""
 
 
-class ErrorView(dict):
+class ErrorView:
     """Error returned by Cybsi Cloud API."""
 
+    __slots__ = ("_code", "_message", "_details")
+
+    def __init__(self, content: JsonObject):
+        self._code = content.get("code")
+        self._message = content.get("message")
+        self._details = content.get("details")
+
     @property
     def code(self) -> str:
         """Error code."""
 
-        return cast(str, self.get("code"))
+        return self._code  # type: ignore[return-value]
 
     @property
     def message(self) -> str:
         """Error message."""
 
-        return cast(str, self.get("message"))
+        return self._message  # type: ignore[return-value]
 
     @property
     def details(self) -> JsonObject:
         """Error details."""
 
-        return cast(JsonObject, self.get("details"))
+        return self._details  # type: ignore[return-value]
 
 
-class SchemaCheckErrorDetails(dict):
+class SchemaCheckErrorDetails:
     """Details for schema check error."""
 
+    __slots__ = ("_absolute_keyword_location", "_instance_location", "_message")
+
+    def __init__(self, details: JsonObject):
+        self._absolute_keyword_location = details.get("AbsoluteKeywordLocation")
+        self._instance_location = details.get("InstanceLocation")
+        self._message = details.get("Message")
+
     @property
     def absolute_keyword_location(self) -> str:
         """Absolute validation path of validating schema."""
 
-        return cast(str, self.get("AbsoluteKeywordLocation"))
+        return self._absolute_keyword_location  # type: ignore[return-value]
 
     @property
     def instance_location(self) -> str:
         """Location of the json value within the instance being validated."""
 
-        return cast(str, self.get("InstanceLocation"))
+        return self._instance_location  # type: ignore[return-value]
 
     @property
     def message(self) -> str:
         """Error description."""
 
-        return cast(str, self.get("Message"))
+        return self._message  # type: ignore[return-value]
 
 
 _error_mapping = {
@@ -325,13 +381,28 @@ _error_mapping = {
     429: TooManyRequestsError,
 }
 
+_MAX_ERROR_BODY_SIZE = 1024
+
+# Error classes indexed by status code offset from 400.
+_error_table: Tuple[Optional[Callable[[httpx.Response], APIError]], ...] = tuple(
+    _error_mapping.get(status) for status in range(400, 430)
+)
+
 
 def _raise_cybsi_error(resp: httpx.Response) -> None:
-    err_cls = _error_mapping.get(resp.status_code, None)
+    # Successful responses pass through, so callers may skip their own check.
+    # Redirects are unexpected for API and raise CybsiError below.
+    if resp.is_success:
+        return
+
+    idx = resp.status_code - 400
+    err_cls = _error_table[idx] if 0 <= idx < len(_error_table) else None
     if err_cls is not None:
         raise err_cls(resp)
 
+    # Unexpected responses can be large (e.g. HTML pages of a proxy),
+    # don't decode the whole body just to build the message.
+    body = resp.content[:_MAX_ERROR_BODY_SIZE].decode(errors="replace")
     raise CybsiError(
-        f"unexpected response status code: {resp.status_code}. "
-        f"Request body: {resp.text}"
+        f"unexpected response status code: {resp.status_code}. Request body: {body}"
     )
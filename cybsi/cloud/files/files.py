@@ -1,9 +1,34 @@
+import asyncio
+import io
+import itertools
+import os
+import re
+import stat
+import time
 import uuid
-from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from functools import cached_property
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
-from httpx import Response
+from httpx import Response, TransportError
 
-from ..error import CybsiError
+from ..error import APIError, CybsiError, TooManyRequestsError
 from ..internal import BaseAPI, BaseAsyncAPI, JsonObjectView
 from ..internal.buffer import (
     AsyncBufferedReader,
@@ -12,13 +37,33 @@ from ..internal.buffer import (
     BufferedReader,
     BytesReader,
     LimitedReader,
+    take,
 )
 from ..internal.multipart import AsyncStreamWrapper
 
 MB = 1 << 20
-_DEFAULT_PART_SIZE = 5 * MB
+# Larger parts mean fewer requests per file.
+_DEFAULT_PART_SIZE = 16 * MB
+_MIN_PART_SIZE = 5 * MB
+_MAX_PART_SIZE = 50 * MB
 _MULTIPART_UPLOAD_MAX_SIZE = 50 * MB
-_DEFAULT_BUF_SIZE = 65536
+# Larger chunks mean fewer iterations per megabyte of a file.
+_DEFAULT_BUF_SIZE = 256 * 1024
+# Chunks are enlarged up to this size for larger reads.
+_MAX_BUF_SIZE = 1 * MB
+_DEFAULT_DOWNLOAD_CONCURRENCY = 4
+_DEFAULT_UPLOAD_CONCURRENCY = 4
+# Failed parts are sent again, with the delay doubled after each attempt.
+_PART_ATTEMPTS = 3
+_RETRY_DELAY = 0.5
+# Retry-After of rate limits is followed up to this delay, as a part buffer
+# is held while waiting.
+_MAX_RETRY_DELAY = 10.0
+
+# Writable bytes-like object, like bytearray or memoryview.
+Buffer = Union[bytearray, memoryview]
+StrPath = Union[str, os.PathLike]
+T = TypeVar("T")
 
 _FILES_PATH = "filebox/files"
 _SESSIONS_PATH = "filebox/sessions"
@@ -26,12 +71,33 @@ _SESSIONS_PATH = "filebox/sessions"
 _CONTENT_RANGE_HEADER = "Content-Range"
 _CONTENT_LENGTH_HEADER = "Content-Length"
 _RANGE_HEADER = "Range"
+_ACCEPT_ENCODING_HEADER = "Accept-Encoding"
+_CONTENT_ENCODING_HEADER = "Content-Encoding"
+_IDENTITY_ENCODINGS = ("", "identity")
+_CONTENT_RANGE_RE = re.compile(r"\s*bytes\s*(\d+)\s*-\s*(\d+)\s*/\s*(\d+)\s*")
 
 
 class FilesAPI(BaseAPI):
-    """Files API."""
-
-    def upload(self, data: BytesReader, *, name: str, size: int = -1) -> "FileRefView":
+    """Files API.
+
+    File parts are downloaded concurrently. Enable ``http2`` option
+    of :class:`~cybsi.cloud.Config` to multiplex part requests
+    over a single connection instead of a connection per part.
+
+    Concurrently transferred parts are sent again with exponential backoff
+    on connection errors, unexpected server errors and rate limits,
+    so a single failed part doesn't fail the whole transfer.
+    """
+
+    def upload(
+        self,
+        data: Union[BytesReader, bytes, Buffer],
+        *,
+        name: str,
+        size: int = -1,
+        concurrency: int = _DEFAULT_UPLOAD_CONCURRENCY,
+        part_size: int = _DEFAULT_PART_SIZE,
+    ) -> "FileRefView":
         """Upload a file.
 
         The maximum file size is 1GiB.
@@ -39,39 +105,151 @@ class FilesAPI(BaseAPI):
         Note:
             Calls `PUT /filebox/files`.
         Args:
-            data (bytes): The data of the file.
+            data (bytes): The data of the file, a reader or a bytes-like object.
             name (str): The name of the file.
-            size (int): The size of the file.
+            size (int): The size of the file, must match the size of the data
+                if it's specified. Ignored for bytes-like data.
+            concurrency: The number of file parts uploaded concurrently
+                if the file is uploaded by parts. The next part is read
+                while the previous ones are uploaded.
+                Parts being uploaded are kept in memory.
+                If it's 1, parts are uploaded sequentially
+                and streamed without buffering.
+                Parts of regular files are read by the uploading threads
+                at their offsets and aren't kept in memory.
+            part_size: The size of file parts if the file is uploaded by parts,
+                from 5 MiB to 50 MiB. Files of unknown size
+                or larger than 50 MiB are uploaded by parts.
         Return:
             The reference to the uploaded file.
         Raises:
+            :class:`ValueError`: Part size is out of range
+                or the specified size doesn't match the data.
             :class:`~cybsi.cloud.error.InvalidRequestError`:
                 Provided values are invalid (see args value requirements).
             :class:`~cybsi.cloud.error.RequestEntityTooLargeError`:
                 Provided file data is too large.
         """
 
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            view = memoryview(data).cast("B")
+            if len(view) > _MULTIPART_UPLOAD_MAX_SIZE:
+                return self._upload_file_by_parts(
+                    _BufferReader(view),
+                    size=len(view),
+                    concurrency=concurrency,
+                    part_size=part_size,
+                )
+            # In-memory data is sent at once, without reading it by chunks.
+            content = data if isinstance(data, bytes) else view.tobytes()
+            r = self._connector.do_put(_FILES_PATH, files={"file": (name, content)})
+            return FileRefView(r.json())
+
         if size <= 0 or size > _MULTIPART_UPLOAD_MAX_SIZE:
-            return self._upload_file_by_parts(data, size=size)
+            return self._upload_file_by_parts(
+                data, size=size, concurrency=concurrency, part_size=part_size
+            )
 
+        # The request body is streamed anyway, the small response is read at once.
         form = {"file": (name, data)}
-        r = self._connector.do_put(_FILES_PATH, files=form, stream=True)
-        r.read()  # in stream mode we need to read the body before use json().
+        r = self._connector.do_put(_FILES_PATH, files=form)
 
         return FileRefView(r.json())
 
     def _upload_file_by_parts(
-        self, data: BytesReader, *, size: int = -1
+        self,
+        data: BytesReader,
+        *,
+        size: int = -1,
+        concurrency: int = _DEFAULT_UPLOAD_CONCURRENCY,
+        part_size: int = _DEFAULT_PART_SIZE,
     ) -> "FileRefView":
-        part_size = _DEFAULT_PART_SIZE
-        session = self.create_session(part_size=part_size)
+        _check_part_size(part_size)
+        file_range = _file_range(data)
+        if file_range is not None:
+            fd, start, rest = file_range
+            if size < 0:
+                size = rest
+            elif size != rest:
+                raise ValueError(f"file size doesn't match: {rest} != {size}")
+            ref = self._upload_file_range(
+                fd, start, start + size, concurrency=concurrency, part_size=part_size
+            )
+            # The file is left at the same position, as if it was read.
+            data.seek(start + size)  # type: ignore[attr-defined]
+            return ref
 
         parts = _iter_parts(data, part_size=part_size, total_size=size)
-        for part_num, (part, part_size) in enumerate(parts, start=1):
-            self.upload_session_part(
-                part, session_id=session.id, part_number=part_num, size=part_size
+        if concurrency <= 1:
+            session = self.create_session(part_size=part_size)
+            for part_num, (part, part_size) in enumerate(parts, start=1):
+                self.upload_session_part(
+                    part, session_id=session.id, part_number=part_num, size=part_size
+                )
+            return self.complete_session(session_id=session.id)
+
+        pool = _BufferPool(part_size)
+
+        def upload_part(buf: bytearray, size: int, part_number: int) -> None:
+            view = memoryview(buf)[:size]
+            try:
+                session_id = session_future.result().id
+                # The part is in memory, so it's read again on retry.
+                _with_retry(
+                    lambda: self.upload_session_part(
+                        _BufferReader(view),
+                        session_id=session_id,
+                        part_number=part_number,
+                        size=size,
+                    )
+                )
+            finally:
+                pool.release(buf)
+
+        # Parts share the source reader, so each part is read into memory
+        # in this thread, while up to concurrency previous parts are uploaded.
+        pending: Deque[Future] = deque()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            # The session is created while the first part is read.
+            session_future = executor.submit(self.create_session, part_size)
+            try:
+                for part_num, (part, _) in enumerate(parts, start=1):
+                    if len(pending) >= concurrency:
+                        pending.popleft().result()
+                    buf = pool.acquire()
+                    size = _read_into(part, buf)
+                    pending.append(executor.submit(upload_part, buf, size, part_num))
+                while pending:
+                    pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        return self.complete_session(session_id=session_future.result().id)
+
+    def _upload_file_range(
+        self, fd: int, start: int, end: int, *, concurrency: int, part_size: int
+    ) -> "FileRefView":
+        # Each part is read from the file by the thread uploading it,
+        # so parts are neither copied into buffers nor read one by one.
+        session = self.create_session(part_size=part_size)
+
+        def upload_part(part_number: int, part_range: Tuple[int, int]) -> None:
+            part_start, part_end = part_range
+            size = part_end - part_start + 1
+            _with_retry(
+                lambda: self.upload_session_part(
+                    _FileRangeReader(fd, part_start, size),
+                    session_id=session.id,
+                    part_number=part_number,
+                    size=size,
+                )
             )
 
+        ranges = _iter_ranges(start, end, part_size)
+        with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+            for _ in executor.map(upload_part, itertools.count(1), ranges):
+                pass
         return self.complete_session(session_id=session.id)
 
     def get_file_size(self, file_id: uuid.UUID) -> int:
@@ -90,10 +268,9 @@ class FilesAPI(BaseAPI):
         """
 
         r = self._connector.do_head(f"{_FILES_PATH}/{file_id}/content")
-        size = r.headers.get(_CONTENT_LENGTH_HEADER).strip()
-        if size:
-            return int(size)
-        return 0
+        # int() skips surrounding whitespace itself.
+        size = r.headers.get(_CONTENT_LENGTH_HEADER)
+        return int(size) if size else 0
 
     def create_session(self, part_size: int) -> "SessionRefView":
         """Create an upload session.
@@ -167,7 +344,12 @@ class FilesAPI(BaseAPI):
         return FileRefView(r.json())
 
     def download_part(
-        self, file_id: uuid.UUID, *, start: int, end: int
+        self,
+        file_id: uuid.UUID,
+        *,
+        start: int,
+        end: int,
+        buffer_size: int = _DEFAULT_BUF_SIZE,
     ) -> "FileContent":
         """Download a file part.
 
@@ -180,6 +362,8 @@ class FilesAPI(BaseAPI):
             file_id: The file identifier.
             start: The part start byte number.
             end: The part end byte number.
+            buffer_size: Size of chunks the content is received by.
+                See :class:`FileContent`.
         Return:
             The file part content.
         Raises:
@@ -190,59 +374,216 @@ class FilesAPI(BaseAPI):
                 The requested content range could not be satisfied.
         """
 
-        headers = {_RANGE_HEADER: f"bytes={start}-{end}"}
+        headers = _range_headers(start, end)
         part = self._connector.do_get(
             path=f"{_FILES_PATH}/{file_id}/content", headers=headers, stream=True
         )
-        return FileContent((p for p in [part]))
-
-    def download(self, file_id: uuid.UUID) -> "FileContent":
+        return FileContent.from_response(part, buffer_size=buffer_size)
+
+    def download(
+        self,
+        file_id: uuid.UUID,
+        *,
+        concurrency: int = _DEFAULT_DOWNLOAD_CONCURRENCY,
+        part_size: int = _DEFAULT_PART_SIZE,
+        buffer_size: int = _DEFAULT_BUF_SIZE,
+    ) -> "FileContent":
         """Download a file entirely.
 
+        Large files are downloaded by parts of 16 MiB by default.
+
         Note:
             Calls `GET /filebox/files/{fileID}/content`.
         Args:
             file_id: The file identifier.
+            concurrency: The number of file parts downloaded concurrently.
+                Parts downloaded ahead of reading are kept in memory.
+                If it's 1, parts are downloaded sequentially
+                and streamed without buffering.
+            part_size: The size of file parts, from 5 MiB to 50 MiB.
+            buffer_size: Size of chunks the content is received by.
+                See :class:`FileContent`.
         Return:
             The file content.
         Raises:
+            :class:`ValueError`: Part size is out of range.
             :class:`~cybsi.cloud.error.InvalidRequestError`:
                 Provided values are invalid (see args value requirements).
             :class:`~cybsi.cloud.error.NotFoundError`: File not found.
         """
 
-        headers = {_RANGE_HEADER: f"bytes=0-{_DEFAULT_PART_SIZE}"}
-        first_part = self._connector.do_get(
-            path=f"{_FILES_PATH}/{file_id}/content", headers=headers, stream=True
-        )
+        _check_part_size(part_size)
+        path = f"{_FILES_PATH}/{file_id}/content"
+        do_get = self._connector.do_get
+        headers = _range_headers(0, part_size - 1)
+        first_part = do_get(path=path, headers=headers, stream=True)
 
-        def parts_iter() -> Iterator[Response]:
-            content_range: str = first_part.headers.get(_CONTENT_RANGE_HEADER)
-            start, end, size = _parse_content_range(content_range)
+        def download_range(start: int, end: int) -> Response:
+            h = _range_headers(start, end)
+            return _with_retry(lambda: do_get(path=path, headers=h))
 
-            yield first_part
+        def parts_iter(part: Response) -> Iterator[Response]:
+            content_range: str = part.headers.get(_CONTENT_RANGE_HEADER)
+            _, end, size = _parse_content_range(content_range)
+
+            yield part
+            # Don't keep the part while the next one is downloaded.
+            del part
+
+            # Ranges of the rest parts are known from the file size.
+            ranges = _iter_ranges(end + 1, size, part_size)
+            if concurrency > 1:
+                yield from _prefetch_parts(download_range, ranges, concurrency)
+                return
+
+            for start, end in ranges:
+                # httpx copies request headers, so the dict is reused.
+                headers[_RANGE_HEADER] = f"bytes={start}-{end}"
+                yield do_get(path=path, headers=headers, stream=True)
+
+        return FileContent(parts_iter(first_part), buffer_size=buffer_size)
+
+    def download_to_buffer(
+        self,
+        file_id: uuid.UUID,
+        buf: Buffer,
+        *,
+        concurrency: int = _DEFAULT_DOWNLOAD_CONCURRENCY,
+        part_size: int = _DEFAULT_PART_SIZE,
+    ) -> int:
+        """Download a file entirely into a pre-allocated buffer.
+
+        File parts are written directly to their places in the buffer,
+        without intermediate copies of the whole content.
+        Use :meth:`get_file_size` to allocate the buffer of the right size.
 
-            bytes_read = end - start + 1
-            while bytes_read < size:
-                start, end = end + 1, end + _DEFAULT_PART_SIZE
-                h = {"Range": f"bytes={start}-{end}"}
+        Note:
+            Calls `HEAD /filebox/files/{fileID}/content`
+            and `GET /filebox/files/{fileID}/content`.
+        Args:
+            file_id: The file identifier.
+            buf: Writable buffer (e.g. :class:`bytearray`) not less than the file.
+            concurrency: The number of file parts downloaded concurrently.
+            part_size: The size of file parts, from 5 MiB to 50 MiB.
+        Return:
+            The file size in bytes.
+        Raises:
+            :class:`ValueError`: The buffer is smaller than the file
+                or part size is out of range.
+            :class:`~cybsi.cloud.error.InvalidRequestError`:
+                Provided values are invalid (see args value requirements).
+            :class:`~cybsi.cloud.error.NotFoundError`: File not found.
+        """
+
+        _check_part_size(part_size)
+        size = self.get_file_size(file_id)
+        view = _buffer_view(buf, size)
+
+        def download_range(part_range: Tuple[int, int]) -> None:
+            start, end = part_range
+            h = _range_headers(start, end)
+
+            def receive() -> None:
                 part = self._connector.do_get(
                     path=f"{_FILES_PATH}/{file_id}/content", headers=h, stream=True
                 )
-                yield part
-                start, end, _ = _parse_content_range(
-                    part.headers.get(_CONTENT_RANGE_HEADER)
-                )
-                bytes_read += end - start + 1
+                with _receiving(part):
+                    offset = start
+                    for chunk in _iter_part_bytes(part, _DEFAULT_BUF_SIZE):
+                        chunk_end = offset + len(chunk)
+                        view[offset:chunk_end] = chunk
+                        offset = chunk_end
+
+            _with_retry(receive)
+
+        ranges = _iter_ranges(0, size, part_size)
+        with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+            for _ in executor.map(download_range, ranges):
+                pass
+        return size
+
+    def download_to(
+        self,
+        file_id: uuid.UUID,
+        dest: StrPath,
+        *,
+        concurrency: int = _DEFAULT_DOWNLOAD_CONCURRENCY,
+        part_size: int = _DEFAULT_PART_SIZE,
+    ) -> int:
+        """Download a file entirely into a local file.
+
+        File parts are written directly to their places in the local file,
+        the content is not kept in memory. If the connection breaks
+        while a part is received, only this part is downloaded again.
 
-        return FileContent(parts_iter())
+        Note:
+            Calls `HEAD /filebox/files/{fileID}/content`
+            and `GET /filebox/files/{fileID}/content`.
+        Args:
+            file_id: The file identifier.
+            dest: Path of the local file. The file is created or truncated.
+            concurrency: The number of file parts downloaded concurrently.
+            part_size: The size of file parts, from 5 MiB to 50 MiB.
+        Return:
+            The file size in bytes.
+        Raises:
+            :class:`ValueError`: Part size is out of range.
+            :class:`~cybsi.cloud.error.CybsiError`: File part download failed.
+            :class:`~cybsi.cloud.error.InvalidRequestError`:
+                Provided values are invalid (see args value requirements).
+            :class:`~cybsi.cloud.error.NotFoundError`: File not found.
+        """
+
+        _check_part_size(part_size)
+        size = self.get_file_size(file_id)
+        with open(dest, "wb") as f:
+            f.truncate(size)
+
+        path = f"{_FILES_PATH}/{file_id}/content"
+        do_get = self._connector.do_get
+
+        def download_range(part_range: Tuple[int, int]) -> None:
+            start, end = part_range
+            h = _range_headers(start, end)
+            # Each part is written by its own file object at its offset.
+            with open(dest, "r+b", buffering=0) as f:
+
+                def receive() -> None:
+                    f.seek(start)
+                    part = do_get(path=path, headers=h, stream=True)
+                    with _receiving(part):
+                        for chunk in _iter_part_bytes(part, _DEFAULT_BUF_SIZE):
+                            f.write(chunk)
+
+                _with_retry(receive)
+
+        ranges = _iter_ranges(0, size, part_size)
+        with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+            for _ in executor.map(download_range, ranges):
+                pass
+        return size
 
 
 class FilesAsyncAPI(BaseAsyncAPI):
-    """Files asynchronous API"""
+    """Files asynchronous API.
+
+    File parts are downloaded concurrently. Enable ``http2`` option
+    of :class:`~cybsi.cloud.Config` to multiplex part requests
+    over a single connection instead of a connection per part.
+
+    Concurrently transferred parts are sent again with exponential backoff
+    on connection errors, unexpected server errors and rate limits,
+    so a single failed part doesn't fail the whole transfer.
+    """
 
     async def upload(
-        self, data: AsyncBytesReader, *, name: str, size: int = -1
+        self,
+        data: Union[AsyncBytesReader, bytes, Buffer],
+        *,
+        name: str,
+        size: int = -1,
+        concurrency: int = _DEFAULT_UPLOAD_CONCURRENCY,
+        part_size: int = _DEFAULT_PART_SIZE,
     ) -> "FileRefView":
         """Upload a file.
 
@@ -251,40 +592,126 @@ class FilesAsyncAPI(BaseAsyncAPI):
         Note:
             Calls `PUT /filebox/files`.
         Args:
-            data (bytes): The data of the file.
+            data (bytes): The data of the file, a reader or a bytes-like object.
             name (str): The name of the file.
-            size (int): The size of the file.
+            size (int): The size of the file, must match the size of the data
+                if it's specified. Ignored for bytes-like data.
+            concurrency: The number of file parts uploaded concurrently
+                if the file is uploaded by parts.
+                Parts being uploaded are kept in memory.
+                If it's 1, parts are uploaded sequentially
+                and streamed without buffering.
+            part_size: The size of file parts if the file is uploaded by parts,
+                from 5 MiB to 50 MiB. Files of unknown size
+                or larger than 50 MiB are uploaded by parts.
         Return:
             The reference to the uploaded file.
         Raises:
+            :class:`ValueError`: Part size is out of range
+                or the specified size doesn't match the data.
             :class:`~cybsi.cloud.error.InvalidRequestError`:
                 Provided values are invalid (see args value requirements).
             :class:`~cybsi.cloud.error.RequestEntityTooLargeError`:
                 Provided file data is too large.
         """
 
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            view = memoryview(data).cast("B")
+            if len(view) > _MULTIPART_UPLOAD_MAX_SIZE:
+                return await self._upload_file_by_parts(
+                    _AsyncBufferReader(view),
+                    name=name,
+                    size=len(view),
+                    concurrency=concurrency,
+                    part_size=part_size,
+                )
+            # In-memory data is sent at once, without reading it by chunks.
+            content = data if isinstance(data, bytes) else view.tobytes()
+            r = await self._connector.do_put(
+                _FILES_PATH, files={"file": (name, content)}
+            )
+            return FileRefView(r.json())
+
         if size <= 0 or size > _MULTIPART_UPLOAD_MAX_SIZE:
-            return await self._upload_file_by_parts(data, name=name, size=size)
+            return await self._upload_file_by_parts(
+                data,
+                name=name,
+                size=size,
+                concurrency=concurrency,
+                part_size=part_size,
+            )
 
+        # The request body is streamed anyway, the small response is read at once.
         form: Dict[str, Any] = {"file": (name, AsyncStreamWrapper(data, size))}
-        r = await self._connector.do_put(_FILES_PATH, files=form, stream=True)
-        await r.aread()  # in stream mode we need to read before use json().
+        r = await self._connector.do_put(_FILES_PATH, files=form)
 
         return FileRefView(r.json())
 
     async def _upload_file_by_parts(
-        self, data: AsyncBytesReader, *, name: str, size: int = -1
+        self,
+        data: AsyncBytesReader,
+        *,
+        name: str,
+        size: int = -1,
+        concurrency: int = _DEFAULT_UPLOAD_CONCURRENCY,
+        part_size: int = _DEFAULT_PART_SIZE,
     ) -> "FileRefView":
-        session = await self.create_session(part_size=_DEFAULT_PART_SIZE)
-        parts = _aiter_parts(data, part_size=_DEFAULT_PART_SIZE, total_size=size)
-
-        part_num = 0
-        async for part, part_size in parts:
-            part_num += 1
-            await self.upload_session_part(
-                part, session_id=session.id, part_number=part_num, size=part_size
-            )
+        _check_part_size(part_size)
+        parts = _aiter_parts(data, part_size=part_size, total_size=size)
+
+        if concurrency <= 1:
+            session = await self.create_session(part_size=part_size)
+            part_num = 0
+            async for part, part_size in parts:
+                part_num += 1
+                await self.upload_session_part(
+                    part, session_id=session.id, part_number=part_num, size=part_size
+                )
+            return await self.complete_session(session_id=session.id)
+
+        # Parts share the source reader, so each part is read into memory
+        # before its upload is started. Up to concurrency parts are uploaded
+        # at once, the next part is read when one of uploads is finished.
+        semaphore = asyncio.Semaphore(concurrency)
+        pool = _BufferPool(part_size)
+        # The session is created while the first part is read.
+        session_task = asyncio.ensure_future(self.create_session(part_size=part_size))
+
+        async def upload_part(buf: bytearray, size: int, part_number: int) -> None:
+            view = memoryview(buf)[:size]
+            try:
+                session = await session_task
+                # The part is in memory, so it's read again on retry.
+                await _awith_retry(
+                    lambda: self.upload_session_part(
+                        _AsyncBufferReader(view),
+                        session_id=session.id,
+                        part_number=part_number,
+                        size=size,
+                    )
+                )
+            finally:
+                pool.release(buf)
+                semaphore.release()
 
+        uploads: List[asyncio.Future] = []
+        try:
+            part_num = 0
+            async for part, _ in parts:
+                await semaphore.acquire()
+                part_num += 1
+                buf = pool.acquire()
+                size = await _aread_into(part, buf)
+                uploads.append(asyncio.ensure_future(upload_part(buf, size, part_num)))
+            await asyncio.gather(*uploads)
+        except BaseException:
+            session_task.cancel()
+            raise
+        finally:
+            for upload in uploads:
+                upload.cancel()
+
+        session = await session_task
         return await self.complete_session(session_id=session.id)
 
     async def get_file_size(self, file_id: uuid.UUID) -> int:
@@ -303,13 +730,17 @@ class FilesAsyncAPI(BaseAsyncAPI):
         """
 
         r = await self._connector.do_head(f"{_FILES_PATH}/{file_id}/content")
-        size = r.headers.get(_CONTENT_LENGTH_HEADER).strip()
-        if size:
-            return int(size)
-        return 0
+        # int() skips surrounding whitespace itself.
+        size = r.headers.get(_CONTENT_LENGTH_HEADER)
+        return int(size) if size else 0
 
     async def download_part(
-        self, file_id: uuid.UUID, *, start: int, end: int
+        self,
+        file_id: uuid.UUID,
+        *,
+        start: int,
+        end: int,
+        buffer_size: int = _DEFAULT_BUF_SIZE,
     ) -> "FileAsyncContent":
         """Download a file part.
 
@@ -322,6 +753,8 @@ class FilesAsyncAPI(BaseAsyncAPI):
             file_id: The file identifier.
             start: The part start byte number.
             end: The part end byte number.
+            buffer_size: Size of chunks the content is received by.
+                See :class:`FileAsyncContent`.
         Return:
             The file part content.
         Raises:
@@ -332,15 +765,11 @@ class FilesAsyncAPI(BaseAsyncAPI):
                 The requested content range could not be satisfied.
         """
 
-        headers = {_RANGE_HEADER: f"bytes={start}-{end}"}
+        headers = _range_headers(start, end)
         part = await self._connector.do_get(
             path=f"{_FILES_PATH}/{file_id}/content", headers=headers, stream=True
         )
-
-        async def part_gen():
-            yield part
-
-        return FileAsyncContent(part_gen())
+        return FileAsyncContent.from_response(part, buffer_size=buffer_size)
 
     async def create_session(self, part_size: int) -> "SessionRefView":
         """Create an upload session.
@@ -412,62 +841,333 @@ class FilesAsyncAPI(BaseAsyncAPI):
         r = await self._connector.do_post(path=path)
         return FileRefView(r.json())
 
-    async def download(self, file_id: uuid.UUID) -> "FileAsyncContent":
+    async def download(
+        self,
+        file_id: uuid.UUID,
+        *,
+        concurrency: int = _DEFAULT_DOWNLOAD_CONCURRENCY,
+        part_size: int = _DEFAULT_PART_SIZE,
+        buffer_size: int = _DEFAULT_BUF_SIZE,
+    ) -> "FileAsyncContent":
         """Download a file entirely.
 
+        Large files are downloaded by parts of 16 MiB by default.
+
         Note:
             Calls `GET /filebox/files/{fileID}/content`.
         Args:
             file_id: The file identifier.
+            concurrency: The number of file parts downloaded concurrently.
+                Parts downloaded ahead of reading are kept in memory.
+                If it's 1, parts are downloaded sequentially
+                and streamed without buffering.
+            part_size: The size of file parts, from 5 MiB to 50 MiB.
+            buffer_size: Size of chunks the content is received by.
+                See :class:`FileAsyncContent`.
         Return:
             The file content.
         Raises:
+            :class:`ValueError`: Part size is out of range.
             :class:`~cybsi.cloud.error.InvalidRequestError`:
                 Provided values are invalid (see args value requirements).
             :class:`~cybsi.cloud.error.NotFoundError`: File not found.
         """
 
-        headers = {_RANGE_HEADER: f"bytes=0-{_DEFAULT_PART_SIZE}"}
-        first_part = await self._connector.do_get(
-            path=f"{_FILES_PATH}/{file_id}/content", headers=headers, stream=True
-        )
+        _check_part_size(part_size)
+        path = f"{_FILES_PATH}/{file_id}/content"
+        do_get = self._connector.do_get
+        headers = _range_headers(0, part_size - 1)
+        first_part = await do_get(path=path, headers=headers, stream=True)
+
+        async def download_range(start: int, end: int) -> Response:
+            h = _range_headers(start, end)
+            return await _awith_retry(lambda: do_get(path=path, headers=h))
 
-        async def parts_iter() -> AsyncIterator[Response]:
-            content_range: str = first_part.headers.get(_CONTENT_RANGE_HEADER)
-            start, end, size = _parse_content_range(content_range)
+        async def parts_iter(part: Response) -> AsyncIterator[Response]:
+            content_range: str = part.headers.get(_CONTENT_RANGE_HEADER)
+            _, end, size = _parse_content_range(content_range)
+
+            yield part
+            # Don't keep the part while the next one is downloaded.
+            del part
+
+            # Ranges of the rest parts are known from the file size.
+            ranges = _iter_ranges(end + 1, size, part_size)
+            if concurrency > 1:
+                async for part in _aprefetch_parts(download_range, ranges, concurrency):
+                    yield part
+                    del part
+                return
+
+            for start, end in ranges:
+                # httpx copies request headers, so the dict is reused.
+                headers[_RANGE_HEADER] = f"bytes={start}-{end}"
+                yield await do_get(path=path, headers=headers, stream=True)
+
+        return FileAsyncContent(parts_iter(first_part), buffer_size=buffer_size)
+
+    async def download_to_buffer(
+        self,
+        file_id: uuid.UUID,
+        buf: Buffer,
+        *,
+        concurrency: int = _DEFAULT_DOWNLOAD_CONCURRENCY,
+        part_size: int = _DEFAULT_PART_SIZE,
+    ) -> int:
+        """Download a file entirely into a pre-allocated buffer.
+
+        File parts are written directly to their places in the buffer,
+        without intermediate copies of the whole content.
+        Use :meth:`get_file_size` to allocate the buffer of the right size.
 
-            yield first_part
+        Note:
+            Calls `HEAD /filebox/files/{fileID}/content`
+            and `GET /filebox/files/{fileID}/content`.
+        Args:
+            file_id: The file identifier.
+            buf: Writable buffer (e.g. :class:`bytearray`) not less than the file.
+            concurrency: The number of file parts downloaded concurrently.
+            part_size: The size of file parts, from 5 MiB to 50 MiB.
+        Return:
+            The file size in bytes.
+        Raises:
+            :class:`ValueError`: The buffer is smaller than the file
+                or part size is out of range.
+            :class:`~cybsi.cloud.error.InvalidRequestError`:
+                Provided values are invalid (see args value requirements).
+            :class:`~cybsi.cloud.error.NotFoundError`: File not found.
+        """
 
-            bytes_read = end - start + 1
-            while bytes_read < size:
-                start, end = end + 1, end + _DEFAULT_PART_SIZE
-                h = {"Range": f"bytes={start}-{end}"}
-                chunk = await self._connector.do_get(
+        _check_part_size(part_size)
+        size = await self.get_file_size(file_id)
+        view = _buffer_view(buf, size)
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def download_range(start: int, end: int) -> None:
+            h = _range_headers(start, end)
+
+            async def receive() -> None:
+                part = await self._connector.do_get(
                     path=f"{_FILES_PATH}/{file_id}/content", headers=h, stream=True
                 )
-                yield chunk
+                async with _areceiving(part):
+                    offset = start
+                    async for chunk in _aiter_part_bytes(part, _DEFAULT_BUF_SIZE):
+                        chunk_end = offset + len(chunk)
+                        view[offset:chunk_end] = chunk
+                        offset = chunk_end
+
+            async with semaphore:
+                await _awith_retry(receive)
+
+        ranges = _iter_ranges(0, size, part_size)
+        await _gather(download_range(start, end) for start, end in ranges)
+        return size
+
+    async def download_to(
+        self,
+        file_id: uuid.UUID,
+        dest: StrPath,
+        *,
+        concurrency: int = _DEFAULT_DOWNLOAD_CONCURRENCY,
+        part_size: int = _DEFAULT_PART_SIZE,
+    ) -> int:
+        """Download a file entirely into a local file.
+
+        File parts are written directly to their places in the local file,
+        the content is not kept in memory. If the connection breaks
+        while a part is received, only this part is downloaded again.
+        File operations run in the default executor of the event loop.
 
-                start, end, _ = _parse_content_range(
-                    chunk.headers.get(_CONTENT_RANGE_HEADER)
-                )
-                bytes_read += end - start + 1
+        Note:
+            Calls `HEAD /filebox/files/{fileID}/content`
+            and `GET /filebox/files/{fileID}/content`.
+        Args:
+            file_id: The file identifier.
+            dest: Path of the local file. The file is created or truncated.
+            concurrency: The number of file parts downloaded concurrently.
+            part_size: The size of file parts, from 5 MiB to 50 MiB.
+        Return:
+            The file size in bytes.
+        Raises:
+            :class:`ValueError`: Part size is out of range.
+            :class:`~cybsi.cloud.error.CybsiError`: File part download failed.
+            :class:`~cybsi.cloud.error.InvalidRequestError`:
+                Provided values are invalid (see args value requirements).
+            :class:`~cybsi.cloud.error.NotFoundError`: File not found.
+        """
+
+        _check_part_size(part_size)
+        size = await self.get_file_size(file_id)
+
+        def create() -> None:
+            with open(dest, "wb") as f:
+                f.truncate(size)
+
+        await _run_blocking(create)
+
+        path = f"{_FILES_PATH}/{file_id}/content"
+        do_get = self._connector.do_get
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def download_range(start: int, end: int) -> None:
+            h = _range_headers(start, end)
+            # Each part is written by its own file object at its offset.
+            async with semaphore:
+                f = await _run_blocking(open, dest, "r+b", 0)
+                try:
+
+                    async def receive() -> None:
+                        await _run_blocking(f.seek, start)
+                        part = await do_get(path=path, headers=h, stream=True)
+                        async with _areceiving(part):
+                            async for chunk in _aiter_part_bytes(
+                                part, _DEFAULT_BUF_SIZE
+                            ):
+                                await _run_blocking(f.write, chunk)
+
+                    await _awith_retry(receive)
+                finally:
+                    f.close()
 
-        return FileAsyncContent(parts_iter())
+        ranges = _iter_ranges(0, size, part_size)
+        await _gather(download_range(start, end) for start, end in ranges)
+        return size
+
+
+class _BufferPool:
+    # Part buffers are reused instead of allocating memory for every part.
+    # The number of buffers is bounded by the number of parts in flight.
+    def __init__(self, size: int):
+        self._size = size
+        self._free: List[bytearray] = []
+
+    def acquire(self) -> bytearray:
+        try:
+            return self._free.pop()
+        except IndexError:
+            return bytearray(self._size)
+
+    def release(self, buf: bytearray) -> None:
+        self._free.append(buf)
+
+
+class _BufferReader:
+    # Seekable reader of a memory buffer. Unlike io.BytesIO, doesn't copy
+    # the buffer. httpx determines upload length by seeking.
+    def __init__(self, view: memoryview):
+        self._view = view
+        self._pos = 0
+
+    def read(self, n: int = -1) -> bytes:
+        start = self._pos
+        size = len(self._view)
+        end = size if n <= 0 else min(start + n, size)
+        self._pos = end
+        return bytes(self._view[start:end])
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._pos = offset
+        return offset
+
+    def tell(self) -> int:
+        return self._pos
+
+
+class _FileRangeReader:
+    # Seekable reader of a file range. Reads at offsets of the file descriptor
+    # and doesn't move the file position, so ranges are read concurrently.
+    def __init__(self, fd: int, start: int, size: int):
+        self._fd = fd
+        self._start = start
+        self._size = size
+        self._pos = 0
+
+    def read(self, n: int = -1) -> bytes:
+        rest = self._size - self._pos
+        n = rest if n < 0 else min(n, rest)
+        if n <= 0:
+            return b""
+        chunk = os.pread(self._fd, n, self._start + self._pos)
+        self._pos += len(chunk)
+        return chunk
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._size
+        self._pos = offset
+        return offset
+
+    def tell(self) -> int:
+        return self._pos
+
+
+class _AsyncBufferReader:
+    # Asynchronous reader of a memory buffer.
+    def __init__(self, view: memoryview):
+        self._reader = _BufferReader(view)
+
+    async def read(self, n: int = -1) -> bytes:
+        return self._reader.read(n)
+
+
+class _AsyncPartsIterator:
+    # Async analog of iter() over responses.
+    def __init__(self, *parts: Response):
+        self._parts = iter(parts)
+
+    def __aiter__(self) -> "_AsyncPartsIterator":
+        return self
+
+    async def __anext__(self) -> Response:
+        try:
+            return next(self._parts)
+        except StopIteration:
+            raise StopAsyncIteration from None
 
 
 class FileAsyncContent:
-    """File asynchronous content."""
+    """File asynchronous content.
+
+    Args:
+        parts: Responses with parts of the content.
+        buffer_size: Size of chunks the content is received by.
+            Larger chunks reduce CPU usage per byte, smaller ones reduce memory usage.
+            Chunks of parts are enlarged up to 1 MiB if larger reads are requested.
+    """
 
-    def __init__(self, parts: AsyncIterator[Response]):
+    def __init__(
+        self, parts: AsyncIterator[Response], *, buffer_size: int = _DEFAULT_BUF_SIZE
+    ):
         self._parts = parts
+        self._buffer_size = buffer_size
+        # Chunk size of the next part, follows the size of reads.
+        self._chunk_size = buffer_size
         self._current_part: Optional[Response] = None
         self._bytes_iter: Optional[AsyncIterator[bytes]] = None
-        self._buffer: bytes = b""
+        # Data received but not read yet.
+        self._buffer = bytearray()
+
+    @classmethod
+    def from_response(
+        cls, resp: Response, *, buffer_size: int = _DEFAULT_BUF_SIZE
+    ) -> "FileAsyncContent":
+        """Make content of a single response."""
+        content = cls(_AsyncPartsIterator(resp), buffer_size=buffer_size)
+        content._current_part = resp
+        return content
 
     async def read(self, n: int = 0) -> bytes:
         """Read at most n bytes of the content.
 
         Return a bytestring containing the bytes read.
+        Fewer than n bytes are returned only at the end of the content.
         If the end of the content is reached, an empty bytes object is returned.
         If n <= 0 it returns the whole content.
         """
@@ -475,52 +1175,81 @@ class FileAsyncContent:
         if n <= 0:
             return await self._readall()
 
-        if self._bytes_iter is None:
-            self._bytes_iter = self._iter_chunked()
-
-        if len(self._buffer) >= n:
-            result = self._buffer[:n]
-            self._buffer = self._buffer[n:]
+        buffer = self._buffer
+        if len(buffer) >= n:
+            # Fast path, take() inlined.
+            with memoryview(buffer) as view:
+                result = bytes(view[:n])
+            del buffer[:n]
             return result
 
-        try:
-            chunk = await self._bytes_iter.__anext__()
-        except StopAsyncIteration:
-            result = self._buffer[:]
-            self._buffer = b""
-            return result
+        self._chunk_size = min(max(n, self._buffer_size), _MAX_BUF_SIZE)
+        # Like io.BufferedReader, return less than n bytes only at the end.
+        while chunk := await self._next_chunk():
+            if not buffer and len(chunk) == n:
+                return chunk
+            buffer += chunk
+            if len(buffer) >= n:
+                break
+        return take(buffer, n)
+
+    async def readinto(self, buf: Buffer) -> int:
+        """Read bytes of the content into a pre-allocated writable buffer.
+
+        Reads until the buffer is full or the end of the content is reached.
+        Return the number of bytes read, 0 if the end of the content is reached.
+        """
 
-        if not self._buffer and len(chunk) <= n:
-            return chunk
+        view = memoryview(buf).cast("B")
+        size = len(view)
+        self._chunk_size = min(max(size, self._buffer_size), _MAX_BUF_SIZE)
+        n = _take_into(self._buffer, view)
 
-        rest = n - len(self._buffer)
-        if rest > len(chunk):
-            result = b"".join((self._buffer, chunk))
-            self._buffer = b""
-        else:
-            result = b"".join((self._buffer, chunk[:rest]))
-            self._buffer = chunk[rest:]
+        while n < size and (chunk := await self._next_chunk()):
+            n += _write_chunk(view, n, chunk, self._buffer)
 
-        return result
+        return n
 
     async def _readall(self) -> bytes:
-        """Read the content entirely."""
-        chunks = []
-        self._bytes_iter = self._iter_chunked()
-        async for buf in self._bytes_iter:
-            chunks.append(buf)
-        return b"".join(chunks)
-
-    def _iter_chunked(self, size=_DEFAULT_BUF_SIZE) -> AsyncIterator[bytes]:
-        """A byte-iterator over the file content."""
-
-        async def chunk_iterator() -> AsyncIterator[bytes]:
-            async for p in self._parts:
-                self._current_part = p
-                async for buf in p.aiter_bytes(size):
-                    yield buf
-
-        return chunk_iterator()
+        """Read the rest of the content entirely."""
+        # Data is written to the result as it arrives and released,
+        # and BytesIO.getvalue() doesn't copy the result.
+        out = io.BytesIO()
+        out.write(self._buffer)
+        self._buffer.clear()
+        # The rest of the current part.
+        if self._bytes_iter is not None:
+            async for chunk in self._bytes_iter:
+                out.write(chunk)
+            self._current_part = None
+            self._bytes_iter = None
+        # Next parts are read entirely, without iterating over chunks.
+        # Content of parts downloaded ahead is taken as is.
+        async for part in self._parts:
+            self._current_part = part
+            out.write(await part.aread())
+            self._current_part = None
+            del part
+        return out.getvalue()
+
+    async def _next_chunk(self) -> bytes:
+        """Next chunk of the content, empty bytes at the end."""
+        # Chunks are taken from the current part directly,
+        # without an intermediate generator over all parts.
+        while True:
+            if self._bytes_iter is not None:
+                async for chunk in self._bytes_iter:
+                    if chunk:
+                        return chunk
+                # Release the drained part before receiving the next one.
+                self._current_part = None
+                self._bytes_iter = None
+            try:
+                part = await self._parts.__anext__()
+            except StopAsyncIteration:
+                return b""
+            self._current_part = part
+            self._bytes_iter = _aiter_part_bytes(part, self._chunk_size)
 
     async def __aenter__(self) -> "FileAsyncContent":
         return self
@@ -531,21 +1260,48 @@ class FileAsyncContent:
     async def close(self):
         if self._current_part is not None:
             await self._current_part.aclose()
+        # Stop downloading parts ahead.
+        aclose = getattr(self._parts, "aclose", None)
+        if aclose is not None:
+            await aclose()
 
 
 class FileContent:
-    """File content."""
+    """File content.
 
-    def __init__(self, parts: Iterator[Response]):
+    Args:
+        parts: Responses with parts of the content.
+        buffer_size: Size of chunks the content is received by.
+            Larger chunks reduce CPU usage per byte, smaller ones reduce memory usage.
+            Chunks of parts are enlarged up to 1 MiB if larger reads are requested.
+    """
+
+    def __init__(
+        self, parts: Iterator[Response], *, buffer_size: int = _DEFAULT_BUF_SIZE
+    ):
         self._parts = parts
+        self._buffer_size = buffer_size
+        # Chunk size of the next part, follows the size of reads.
+        self._chunk_size = buffer_size
         self._current_part: Optional[Response] = None
         self._bytes_iter: Optional[Iterator[bytes]] = None
-        self._buffer: bytes = b""
+        # Data received but not read yet.
+        self._buffer = bytearray()
+
+    @classmethod
+    def from_response(
+        cls, resp: Response, *, buffer_size: int = _DEFAULT_BUF_SIZE
+    ) -> "FileContent":
+        """Make content of a single response."""
+        content = cls(iter((resp,)), buffer_size=buffer_size)
+        content._current_part = resp
+        return content
 
     def read(self, n: int = 0) -> bytes:
         """Read at most n bytes of the content.
 
         Return a bytestring containing the bytes read.
+        Fewer than n bytes are returned only at the end of the content.
 
         If the end of the content is reached, an empty bytes object is returned.
         If n <= 0 it returns the whole content.
@@ -554,52 +1310,80 @@ class FileContent:
         if n <= 0:
             return self._readall()
 
-        if self._bytes_iter is None:
-            self._bytes_iter = self._iter_chunked()
-
-        if len(self._buffer) >= n:
-            result = self._buffer[:n]
-            self._buffer = self._buffer[n:]
+        buffer = self._buffer
+        if len(buffer) >= n:
+            # Fast path, take() inlined.
+            with memoryview(buffer) as view:
+                result = bytes(view[:n])
+            del buffer[:n]
             return result
 
-        try:
-            chunk = next(self._bytes_iter)
-        except StopIteration:
-            result = self._buffer[:]
-            self._buffer = b""
-            return result
+        self._chunk_size = min(max(n, self._buffer_size), _MAX_BUF_SIZE)
+        # Like io.BufferedReader, return less than n bytes only at the end.
+        while chunk := self._next_chunk():
+            if not buffer and len(chunk) == n:
+                return chunk
+            buffer += chunk
+            if len(buffer) >= n:
+                break
+        return take(buffer, n)
+
+    def readinto(self, buf: Buffer) -> int:
+        """Read bytes of the content into a pre-allocated writable buffer.
+
+        Reads until the buffer is full or the end of the content is reached.
+        Return the number of bytes read, 0 if the end of the content is reached.
+        """
 
-        if not self._buffer and len(chunk) <= n:
-            return chunk
+        view = memoryview(buf).cast("B")
+        size = len(view)
+        self._chunk_size = min(max(size, self._buffer_size), _MAX_BUF_SIZE)
+        n = _take_into(self._buffer, view)
 
-        rest = n - len(self._buffer)
-        if rest > len(chunk):
-            result = b"".join((self._buffer, chunk))
-            self._buffer = b""
-        else:
-            result = b"".join((self._buffer, chunk[:rest]))
-            self._buffer = chunk[rest:]
+        while n < size and (chunk := self._next_chunk()):
+            n += _write_chunk(view, n, chunk, self._buffer)
 
-        return result
+        return n
 
     def _readall(self) -> bytes:
-        """Read the content entirely."""
-        chunks = []
-        self._bytes_iter = self._iter_chunked()
-        for buf in self._bytes_iter:
-            chunks.append(buf)
-        return b"".join(chunks)
-
-    def _iter_chunked(self, size=_DEFAULT_BUF_SIZE) -> Iterator[bytes]:
-        """A byte-iterator over the file content."""
-
-        def chunk_iterator() -> Iterator[bytes]:
-            for p in self._parts:
-                self._current_part = p
-                for buf in p.iter_bytes(size):
-                    yield buf
-
-        return chunk_iterator()
+        """Read the rest of the content entirely."""
+        # Data is written to the result as it arrives and released,
+        # and BytesIO.getvalue() doesn't copy the result.
+        out = io.BytesIO()
+        out.write(self._buffer)
+        self._buffer.clear()
+        # The rest of the current part.
+        if self._bytes_iter is not None:
+            for chunk in self._bytes_iter:
+                out.write(chunk)
+            self._current_part = None
+            self._bytes_iter = None
+        # Next parts are read entirely, without iterating over chunks.
+        # Content of parts downloaded ahead is taken as is.
+        for part in self._parts:
+            self._current_part = part
+            out.write(part.read())
+            self._current_part = None
+            del part
+        return out.getvalue()
+
+    def _next_chunk(self) -> bytes:
+        """Next chunk of the content, empty bytes at the end."""
+        # Chunks are taken from the current part directly,
+        # without an intermediate generator over all parts.
+        while True:
+            if self._bytes_iter is not None:
+                for chunk in self._bytes_iter:
+                    if chunk:
+                        return chunk
+                # Release the drained part before receiving the next one.
+                self._current_part = None
+                self._bytes_iter = None
+            part = next(self._parts, None)
+            if part is None:
+                return b""
+            self._current_part = part
+            self._bytes_iter = _iter_part_bytes(part, self._chunk_size)
 
     def __enter__(self) -> "FileContent":
         return self
@@ -610,12 +1394,16 @@ class FileContent:
     def close(self):
         if self._current_part is not None:
             self._current_part.close()
+        # Stop downloading parts ahead.
+        close = getattr(self._parts, "close", None)
+        if close is not None:
+            close()
 
 
 class FileRefView(JsonObjectView):
     """File reference view."""
 
-    @property
+    @cached_property
     def id(self) -> uuid.UUID:
         """File ID."""
         return uuid.UUID(self._get("fileID"))
@@ -624,61 +1412,310 @@ class FileRefView(JsonObjectView):
 class SessionRefView(JsonObjectView):
     """Upload session reference view."""
 
-    @property
+    @cached_property
     def id(self) -> uuid.UUID:
         """Session ID."""
         return uuid.UUID(self._get("sessionID"))
 
 
+def _range_headers(start: int, end: int) -> Dict[str, str]:
+    # File content is requested uncompressed to be read raw,
+    # files are usually binary or compressed already.
+    return {
+        _RANGE_HEADER: f"bytes={start}-{end}",
+        _ACCEPT_ENCODING_HEADER: "identity",
+    }
+
+
 def _parse_content_range(header: str) -> Tuple[int, int, int]:
-    header = header.strip()
-    bytes_prefix = "bytes"
-    if not header.startswith(bytes_prefix):
+    match = _CONTENT_RANGE_RE.fullmatch(header)
+    if match is None:
         raise CybsiError("invalid content range header")
-    bytes_prefix_len = len(bytes_prefix)
-    header = header[bytes_prefix_len:].strip()
+    start, end, size = match.groups()
+    return int(start), int(end), int(size)
+
+
+def _is_raw(part: Response) -> bool:
+    # File content is an octet-stream, it's decoded only if the server
+    # compressed it. Content of responses read entirely is kept decoded.
+    encoding = part.headers.get(_CONTENT_ENCODING_HEADER, "")
+    return encoding.lower() in _IDENTITY_ENCODINGS and not part.is_stream_consumed
+
+
+def _iter_part_bytes(part: Response, size: int) -> Iterator[bytes]:
+    # Raw iteration skips the content decoders of httpx.
+    if _is_raw(part):
+        return part.iter_raw(size)
+    return part.iter_bytes(size)
+
+
+def _aiter_part_bytes(part: Response, size: int) -> AsyncIterator[bytes]:
+    if _is_raw(part):
+        return part.aiter_raw(size)
+    return part.aiter_bytes(size)
+
+
+def _take_into(buffer: bytearray, view: memoryview) -> int:
+    # Move buffered data to the start of the view.
+    n = min(len(buffer), len(view))
+    view[:n] = buffer[:n]
+    del buffer[:n]
+    return n
+
+
+def _write_chunk(view: memoryview, offset: int, chunk: bytes, rest: bytearray) -> int:
+    # Write chunk to the view at offset, keep the part not fitting the view.
+    n = min(len(view) - offset, len(chunk))
+    end = offset + n
+    if n < len(chunk):
+        chunk_view = memoryview(chunk)
+        view[offset:end] = chunk_view[:n]
+        rest += chunk_view[n:]
+    else:
+        view[offset:end] = chunk
+    return n
+
+
+def _buffer_view(buf: Buffer, size: int) -> memoryview:
+    view = memoryview(buf).cast("B")
+    if view.readonly:
+        raise ValueError("buffer is read-only")
+    if len(view) < size:
+        raise ValueError(f"buffer is too small: {len(view)} < {size}")
+    return view
+
+
+def _read_into(source: BytesReader, buf: bytearray) -> int:
+    # Read the source into the buffer until the end of either.
+    # Source is read by small chunks to not allocate the part size twice.
+    n = 0
+    size = len(buf)
+    with memoryview(buf) as view:
+        while n < size:
+            chunk = source.read(min(size - n, _DEFAULT_BUF_SIZE))
+            if not chunk:
+                break
+            end = n + len(chunk)
+            view[n:end] = chunk
+            n = end
+    return n
+
+
+async def _aread_into(source: AsyncBytesReader, buf: bytearray) -> int:
+    n = 0
+    size = len(buf)
+    with memoryview(buf) as view:
+        while n < size:
+            chunk = await source.read(min(size - n, _DEFAULT_BUF_SIZE))
+            if not chunk:
+                break
+            end = n + len(chunk)
+            view[n:end] = chunk
+            n = end
+    return n
+
+
+def _check_part_size(part_size: int) -> None:
+    if not _MIN_PART_SIZE <= part_size <= _MAX_PART_SIZE:
+        raise ValueError(
+            f"part size must be from {_MIN_PART_SIZE} to {_MAX_PART_SIZE} bytes"
+        )
+
+
+def _retry_delay(exp: CybsiError, attempt: int) -> Optional[float]:
+    # Connection errors, unexpected statuses (5xx) and rate limits are transient.
+    # Other API errors are not retried, they would fail again.
+    # None means no more attempts.
+    if attempt >= _PART_ATTEMPTS:
+        return None
+    if isinstance(exp, TooManyRequestsError):
+        if exp.retry_after is not None:
+            return min(exp.retry_after, _MAX_RETRY_DELAY)
+    elif isinstance(exp, APIError):
+        return None
+    return _RETRY_DELAY * 2 ** (attempt - 1)
+
+
+def _with_retry(send: Callable[[], T]) -> T:
+    attempt = 1
+    while True:
+        try:
+            return send()
+        except CybsiError as exp:
+            delay = _retry_delay(exp, attempt)
+            if delay is None:
+                raise
+        time.sleep(delay)
+        attempt += 1
+
+
+async def _run_blocking(fn: Callable[..., T], *args: Any) -> T:
+    # Runs fn in the default executor. If cancelled, waits for fn to finish,
+    # so that a file isn't closed while it's written in the executor.
+    future = asyncio.get_running_loop().run_in_executor(None, fn, *args)
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        await asyncio.wait([future])
+        raise
+
 
-    content_range, size = header.split("/", maxsplit=1)
-    start, end = content_range.split("-", maxsplit=1)
+async def _gather(aws: Iterable[Awaitable[Any]]) -> None:
+    # Unlike asyncio.gather, on the first error the rest are cancelled
+    # and awaited, so they don't keep running after the error is raised.
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def _awith_retry(send: Callable[[], Awaitable[T]]) -> T:
+    attempt = 1
+    while True:
+        try:
+            return await send()
+        except CybsiError as exp:
+            delay = _retry_delay(exp, attempt)
+            if delay is None:
+                raise
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+@contextmanager
+def _receiving(part: Response) -> Iterator[Response]:
+    # Closes the part, broken connection while its content is received
+    # is reported like the one while the request is sent.
+    try:
+        yield part
+    except TransportError as exp:
+        raise CybsiError("could not receive file part", exp) from exp
+    finally:
+        part.close()
+
+
+@asynccontextmanager
+async def _areceiving(part: Response) -> AsyncIterator[Response]:
+    try:
+        yield part
+    except TransportError as exp:
+        raise CybsiError("could not receive file part", exp) from exp
+    finally:
+        await part.aclose()
+
+
+def _file_range(data: BytesReader) -> Optional[Tuple[int, int, int]]:
+    # File descriptor, current position and the rest size of a regular file,
+    # None if data is not a regular file or positional reads are unsupported.
+    if not hasattr(os, "pread"):
+        return None
+    # Only raw or buffered binary files read bytes as they are on disk.
+    # Other objects with fileno(), like text or compressed files, transform them.
+    raw = data.raw if isinstance(data, (io.BufferedReader, io.BufferedRandom)) else data
+    if not isinstance(raw, io.FileIO):
+        return None
+    try:
+        fd = raw.fileno()
+        start = data.tell()  # type: ignore[attr-defined]
+        st = os.fstat(fd)
+    except (AttributeError, OSError, ValueError):
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return fd, start, max(st.st_size - start, 0)
+
+
+def _iter_ranges(start: int, size: int, part_size: int) -> Iterator[Tuple[int, int]]:
+    # Inclusive byte ranges of parts from start to the end of content.
+    while start < size:
+        end = min(start + part_size, size) - 1
+        yield start, end
+        start = end + 1
+
+
+def _prefetch_parts(
+    fetch: Callable[[int, int], Response],
+    ranges: Iterator[Tuple[int, int]],
+    concurrency: int,
+) -> Iterator[Response]:
+    # Download up to concurrency parts ahead, yield them in order.
+    pending: Deque[Future] = deque()
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        for start, end in ranges:
+            pending.append(executor.submit(fetch, start, end))
+            if len(pending) >= concurrency:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        # Parts being downloaded aren't needed if the content is closed,
+        # so their downloads aren't waited for.
+        executor.shutdown(wait=False)
+
+
+async def _aprefetch_parts(
+    fetch: Callable[[int, int], Awaitable[Response]],
+    ranges: Iterator[Tuple[int, int]],
+    concurrency: int,
+) -> AsyncIterator[Response]:
+    # Download up to concurrency parts ahead, yield them in order.
+    pending: Deque[asyncio.Future] = deque()
     try:
-        return int(start.strip()), int(end.strip()), int(size.strip())
-    except ValueError as exp:
-        raise CybsiError("invalid content range") from exp
+        for start, end in ranges:
+            pending.append(asyncio.ensure_future(fetch(start, end)))
+            if len(pending) >= concurrency:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
 
 
 def _iter_parts(
     source: BytesReader, part_size: int, total_size=-1
 ) -> Iterator[Tuple[BytesReader, int]]:
-    # if total size is not specified the buffer size would be equal to part size.
-    buf_size = 1 if total_size > 0 else part_size
-    buf = BufferedReader(source, size=buf_size)
-
-    part_number = 0
-    while peeked := buf.peek(buf_size):
-        if total_size < 0:
-            size = len(peeked)
-            yield LimitedReader(buf, limit=size), size
-        else:
-            part_number += 1
-            rest = total_size - (part_number * part_size)
-            size = part_size if rest > 0 else total_size % part_size
-            yield LimitedReader(buf, limit=size), size
+    if total_size >= 0:
+        # Part sizes are known, the source is read by parts as is.
+        full, last = divmod(total_size, part_size)
+        for _ in range(full):
+            yield LimitedReader(source, limit=part_size), part_size
+        if last:
+            yield LimitedReader(source, limit=last), last
+        if source.read(1):
+            raise ValueError(f"data is larger than size: {total_size}")
+        return
+
+    # The buffer size is equal to part size to know the size of each part.
+    buf = BufferedReader(source, size=part_size)
+    while peeked := buf.peek(part_size):
+        size = len(peeked)
+        yield LimitedReader(buf, limit=size), size
 
 
 async def _aiter_parts(
     source: AsyncBytesReader, part_size: int, total_size=-1
 ) -> AsyncIterator[Tuple[AsyncBytesReader, int]]:
-    # if total size is not specified the buffer size would be equal to part size.
-    buf_size = 1 if total_size > 0 else part_size
-    buf = AsyncBufferedReader(source, size=buf_size)
-
-    part_number = 0
-    while peeked := (await buf.peek(buf_size)):
-        if total_size < 0:
-            size = len(peeked)
-            yield AsyncLimitedReader(buf, limit=size), size
-        else:
-            part_number += 1
-            rest = total_size - (part_number * part_size)
-            size = part_size if rest > 0 else total_size % part_size
-            yield AsyncLimitedReader(buf, limit=size), size
+    if total_size >= 0:
+        # Part sizes are known, the source is read by parts as is.
+        full, last = divmod(total_size, part_size)
+        for _ in range(full):
+            yield AsyncLimitedReader(source, limit=part_size), part_size
+        if last:
+            yield AsyncLimitedReader(source, limit=last), last
+        if await source.read(1):
+            raise ValueError(f"data is larger than size: {total_size}")
+        return
+
+    # The buffer size is equal to part size to know the size of each part.
+    buf = AsyncBufferedReader(source, size=part_size)
+    while peeked := (await buf.peek(part_size)):
+        size = len(peeked)
+        yield AsyncLimitedReader(buf, limit=size), size
@@ -24,4 +24,9 @@ from .tasks import (
     TaskView,
 )
 
-from .task_queue import TaskQueueAPI, TaskQueueAsyncAPI, TaskQueueItemView
+from .task_queue import (
+    TaskCompletionForm,
+    TaskQueueAPI,
+    TaskQueueAsyncAPI,
+    TaskQueueItemView,
+)
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from ..internal import BaseAPI, BaseAsyncAPI
 from .schemas import SchemaAPI, SchemaAsyncAPI
 from .task_queue import TaskQueueAPI, TaskQueueAsyncAPI
@@ -7,17 +9,17 @@ from .tasks import TaskAPI, TaskAsyncAPI
 class InsightAPI(BaseAPI):
     """Insight API."""
 
-    @property
+    @cached_property
     def schemas(self) -> SchemaAPI:
         """Get Insight schemas handle."""
         return SchemaAPI(self._connector)
 
-    @property
+    @cached_property
     def tasks(self) -> TaskAPI:
         """Get Insight task handle."""
         return TaskAPI(self._connector)
 
-    @property
+    @cached_property
     def task_queue(self) -> TaskQueueAPI:
         """Get Insight task queue handle."""
         return TaskQueueAPI(self._connector)
@@ -26,17 +28,17 @@ class InsightAPI(BaseAPI):
 class InsightAsyncAPI(BaseAsyncAPI):
     """Insight asynchronous API."""
 
-    @property
+    @cached_property
     def schemas(self) -> SchemaAsyncAPI:
         """Schemas asynchronous API handle."""
         return SchemaAsyncAPI(self._connector)
 
-    @property
+    @cached_property
     def tasks(self) -> TaskAsyncAPI:
         """Tasks asynchronous API handle."""
         return TaskAsyncAPI(self._connector)
 
-    @property
+    @cached_property
     def task_queue(self) -> TaskQueueAsyncAPI:
         """Task queue asynchronous API handle."""
         return TaskQueueAsyncAPI(self._connector)
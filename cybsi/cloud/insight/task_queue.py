@@ -1,11 +1,29 @@
+import asyncio
+import random
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Iterable, List
+from functools import cached_property
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
+from .._json import json_loads
 from ..internal import (
+    AsyncHTTPConnector,
     BaseAPI,
     BaseAsyncAPI,
     JsonObject,
+    JsonObjectForm,
     JsonObjectView,
     parse_rfc3339_timestamp,
 )
@@ -13,9 +31,23 @@ from .tasks import ObjectKeyForm, ObjectType, TaskParamsView
 
 _PATH = "insight/task-queue"
 
+# Intervals in seconds between polls of the empty queue.
+_MIN_POLL_INTERVAL = 0.2
+_MAX_POLL_INTERVAL = 30.0
+_POLL_JITTER = 0.1
+_DEFAULT_COMPLETION_CONCURRENCY = 16
+# The maximum limit of tasks popped by a request.
+_MAX_POP_LIMIT = 100
+
 
 class TaskQueueAPI(BaseAPI):
-    """Task queue API."""
+    """Task queue API.
+
+    Requests of the handle use the connection pool of its client.
+    Share one client between workers instead of creating a client
+    per worker, and enable ``http2`` option of :class:`~cybsi.cloud.Config`
+    to multiplex their requests over a single connection.
+    """
 
     def pop_tasks(self, *, limit: int) -> List["TaskQueueItemView"]:
         """Take the list of enrichment tasks to execution.
@@ -32,12 +64,51 @@ class TaskQueueAPI(BaseAPI):
         """
         path = f"{_PATH}/executing-tasks"
         resp = self._connector.do_post(path=path, json={"limit": limit})
-        return [TaskQueueItemView(task) for task in resp.json()]
+        # Many tasks can be popped at once, decode them with orjson if available.
+        return list(map(TaskQueueItemView, json_loads(resp.content)))
+
+    def pop_tasks_polling(
+        self,
+        *,
+        limit: int,
+        min_interval: float = _MIN_POLL_INTERVAL,
+        max_interval: float = _MAX_POLL_INTERVAL,
+        jitter: float = _POLL_JITTER,
+    ) -> Iterator["TaskQueueItemView"]:
+        """Take enrichment tasks to execution as they appear in the queue.
+
+        The queue is polled again at once while it returns tasks.
+        Polls of the empty queue are delayed, the delay is doubled
+        after each empty poll up to `max_interval`, with random jitter
+        added to spread polls of concurrent workers.
+
+        Note:
+            Calls `POST /insight/task-queue/executing-tasks`.
+        Args:
+            limit: The maximum number of tasks taken by a poll.
+            min_interval: The delay in seconds after the first empty poll.
+            max_interval: The maximum delay in seconds between polls.
+            jitter: The maximum jitter, as a fraction of the delay.
+        Returns:
+            Endless iterator of task queue item views.
+        Raises:
+            :class:`~cybsi.cloud.error.InvalidRequestError`:
+                Provided values are invalid (see args value requirements).
+        """
+        interval = min_interval
+        while True:
+            tasks = self.pop_tasks(limit=limit)
+            if tasks:
+                interval = min_interval
+                yield from tasks
+                continue
+            time.sleep(_jittered(interval, jitter))
+            interval = min(interval * 2, max_interval)
 
     def complete_task(
         self,
         *,
-        task_id: uuid.UUID,
+        task_id: Union[uuid.UUID, str],
         obj_type: ObjectType,
         keys: Iterable[ObjectKeyForm],
         context: JsonObject = {},
@@ -47,7 +118,7 @@ class TaskQueueAPI(BaseAPI):
         Note:
             Calls `POST /insight/task-queue/completed-tasks`.
         Args:
-            task_id: Task identifier.
+            task_id: Task identifier, :class:`~uuid.UUID` or its string.
             obj_type: Type of the object.
             keys: Keys of the object.
             context: Additional data describing object.
@@ -67,23 +138,55 @@ class TaskQueueAPI(BaseAPI):
             :attr:`~cybsi.cloud.insight.tasks.TaskForm`.
         """
         path = f"{_PATH}/completed-tasks"
-        payload = {
-            "taskID": str(task_id),
-            "result": {
-                "type": obj_type.value,
-                "keys": [key.json() for key in keys],
-                "context": context,
-            },
-        }
-        self._connector.do_post(path=path, json=payload)
+        form = TaskCompletionForm(
+            task_id=task_id, obj_type=obj_type, keys=keys, context=context
+        )
+        self._connector.do_post(path=path, json=form.json())
+
+    def complete_tasks(
+        self,
+        completions: Iterable["TaskCompletionForm"],
+        *,
+        concurrency: int = _DEFAULT_COMPLETION_CONCURRENCY,
+    ) -> None:
+        """Register successful enrichment results of several tasks.
 
-    def fail_task(self, *, task_id: uuid.UUID, code: str, message: str) -> None:
+        Results are registered concurrently, a request per task.
+
+        Note:
+            Calls `POST /insight/task-queue/completed-tasks`.
+        Args:
+            completions: Enrichment results.
+            concurrency: The maximum number of results registered concurrently.
+        Raises:
+            :class:`~cybsi.cloud.error.CybsiError`: The first error of result
+                registration, see :meth:`complete_task`.
+                Registration stops on the error: results not sent yet are skipped,
+                results already sent may stay registered.
+        """
+        path = f"{_PATH}/completed-tasks"
+
+        def complete(form: TaskCompletionForm) -> None:
+            self._connector.do_post(path=path, json=form.json())
+
+        with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+            futures = [executor.submit(complete, form) for form in completions]
+            try:
+                for future in futures:
+                    future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def fail_task(
+        self, *, task_id: Union[uuid.UUID, str], code: str, message: str
+    ) -> None:
         """Register the enrichment error.
 
         Note:
             Calls `POST /insight/task-queue/failed-tasks`.
         Args:
-            task_id: Task identifier.
+            task_id: Task identifier, :class:`~uuid.UUID` or its string.
             code: Enrichment error code.
             message: Enrichment error message.
         Note:
@@ -103,11 +206,26 @@ class TaskQueueAPI(BaseAPI):
 
 
 class TaskQueueAsyncAPI(BaseAsyncAPI):
-    """Task queue asynchronous API."""
+    """Task queue asynchronous API.
+
+    Requests of the handle use the connection pool of its client.
+    Share one client between workers instead of creating a client
+    per worker, and enable ``http2`` option of :class:`~cybsi.cloud.Config`
+    to multiplex their requests over a single connection.
+    """
+
+    def __init__(self, connector: AsyncHTTPConnector):
+        super().__init__(connector)
+        self._pops = _PopCoalescer(self._pop_tasks)
 
     async def pop_tasks(self, *, limit: int) -> List["TaskQueueItemView"]:
         """Take the list of enrichment tasks to execution.
 
+        Concurrent calls are coalesced: calls made while the previous
+        request is in flight are sent as a single request
+        with the summed limit, and its tasks are split between them.
+        Coalesced requests take at most 100 tasks each.
+
         Note:
             Calls `POST /insight/task-queue/executing-tasks`.
         Args:
@@ -118,14 +236,60 @@ class TaskQueueAsyncAPI(BaseAsyncAPI):
             :class:`~cybsi.cloud.error.InvalidRequestError`:
                 Provided values are invalid (see args value requirements).
         """
+        if limit <= 0:
+            # Invalid limit must not fail the coalesced calls.
+            return await self._pop_tasks(limit)
+        return await self._pops.pop(limit)
+
+    async def pop_tasks_polling(
+        self,
+        *,
+        limit: int,
+        min_interval: float = _MIN_POLL_INTERVAL,
+        max_interval: float = _MAX_POLL_INTERVAL,
+        jitter: float = _POLL_JITTER,
+    ) -> AsyncIterator["TaskQueueItemView"]:
+        """Take enrichment tasks to execution as they appear in the queue.
+
+        The queue is polled again at once while it returns tasks.
+        Polls of the empty queue are delayed, the delay is doubled
+        after each empty poll up to `max_interval`, with random jitter
+        added to spread polls of concurrent workers.
+
+        Note:
+            Calls `POST /insight/task-queue/executing-tasks`.
+        Args:
+            limit: The maximum number of tasks taken by a poll.
+            min_interval: The delay in seconds after the first empty poll.
+            max_interval: The maximum delay in seconds between polls.
+            jitter: The maximum jitter, as a fraction of the delay.
+        Returns:
+            Endless asynchronous iterator of task queue item views.
+        Raises:
+            :class:`~cybsi.cloud.error.InvalidRequestError`:
+                Provided values are invalid (see args value requirements).
+        """
+        interval = min_interval
+        while True:
+            tasks = await self.pop_tasks(limit=limit)
+            if tasks:
+                interval = min_interval
+                for task in tasks:
+                    yield task
+                continue
+            await asyncio.sleep(_jittered(interval, jitter))
+            interval = min(interval * 2, max_interval)
+
+    async def _pop_tasks(self, limit: int) -> List["TaskQueueItemView"]:
         path = f"{_PATH}/executing-tasks"
         resp = await self._connector.do_post(path=path, json={"limit": limit})
-        return [TaskQueueItemView(task) for task in resp.json()]
+        # Many tasks can be popped at once, decode them with orjson if available.
+        return list(map(TaskQueueItemView, json_loads(resp.content)))
 
     async def complete_task(
         self,
         *,
-        task_id: uuid.UUID,
+        task_id: Union[uuid.UUID, str],
         obj_type: ObjectType,
         keys: Iterable[ObjectKeyForm],
         context: JsonObject = {},
@@ -135,7 +299,7 @@ class TaskQueueAsyncAPI(BaseAsyncAPI):
         Note:
             Calls `POST /insight/task-queue/completed-tasks`.
         Args:
-            task_id: Task identifier.
+            task_id: Task identifier, :class:`~uuid.UUID` or its string.
             obj_type: Type of the object.
             keys: Keys of the object.
             context: Additional data describing object.
@@ -155,23 +319,65 @@ class TaskQueueAsyncAPI(BaseAsyncAPI):
             :attr:`~cybsi.cloud.insight.tasks.TaskForm`.
         """
         path = f"{_PATH}/completed-tasks"
-        payload = {
-            "taskID": str(task_id),
-            "result": {
-                "type": obj_type.value,
-                "keys": [key.json() for key in keys],
-                "context": context,
-            },
-        }
-        await self._connector.do_post(path=path, json=payload)
+        form = TaskCompletionForm(
+            task_id=task_id, obj_type=obj_type, keys=keys, context=context
+        )
+        await self._connector.do_post(path=path, json=form.json())
+
+    async def complete_tasks(
+        self,
+        completions: Iterable["TaskCompletionForm"],
+        *,
+        concurrency: int = _DEFAULT_COMPLETION_CONCURRENCY,
+    ) -> None:
+        """Register successful enrichment results of several tasks.
+
+        Results are registered concurrently, a request per task.
+
+        Note:
+            Calls `POST /insight/task-queue/completed-tasks`.
+        Args:
+            completions: Enrichment results.
+            concurrency: The maximum number of results registered concurrently.
+        Raises:
+            :class:`~cybsi.cloud.error.CybsiError`: The first error of result
+                registration, see :meth:`complete_task`.
+                Registration stops on the error: results not sent yet are skipped,
+                results already sent may stay registered.
+        """
+        path = f"{_PATH}/completed-tasks"
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def complete(form: TaskCompletionForm) -> None:
+            try:
+                await self._connector.do_post(path=path, json=form.json())
+            finally:
+                semaphore.release()
+
+        pending: List[asyncio.Future] = []
+        try:
+            for form in completions:
+                await semaphore.acquire()
+                for future in pending:
+                    if future.done():
+                        future.result()  # raises the error of failed registration
+                pending = [future for future in pending if not future.done()]
+                pending.append(asyncio.ensure_future(complete(form)))
+            await asyncio.gather(*pending)
+        finally:
+            for future in pending:
+                future.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
-    async def fail_task(self, *, task_id: uuid.UUID, code: str, message: str) -> None:
+    async def fail_task(
+        self, *, task_id: Union[uuid.UUID, str], code: str, message: str
+    ) -> None:
         """Register the enrichment error.
 
         Note:
             Calls `POST /insight/task-queue/failed-tasks`.
         Args:
-            task_id: Task identifier.
+            task_id: Task identifier, :class:`~uuid.UUID` or its string.
             code: Enrichment error code.
             message: Enrichment error message.
         Note:
@@ -193,7 +399,7 @@ class TaskQueueAsyncAPI(BaseAsyncAPI):
 class TaskQueueItemView(JsonObjectView):
     """Task queue item view."""
 
-    @property
+    @cached_property
     def id(self) -> uuid.UUID:
         """Task identifier."""
         return uuid.UUID(self._get("id"))
@@ -207,3 +413,120 @@ class TaskQueueItemView(JsonObjectView):
     def params(self) -> TaskParamsView:
         """Task params."""
         return TaskParamsView(self._get("params"))
+
+
+class TaskCompletionForm(JsonObjectForm):
+    """Successful enrichment result form.
+
+    Args:
+        task_id: Task identifier, :class:`~uuid.UUID` or its string.
+        obj_type: Type of the object.
+        keys: Keys of the object.
+        context: Additional data describing object.
+    """
+
+    def __init__(
+        self,
+        *,
+        task_id: Union[uuid.UUID, str],
+        obj_type: ObjectType,
+        keys: Iterable[ObjectKeyForm],
+        context: Optional[JsonObject] = None,
+    ):
+        super().__init__()
+        self._data["taskID"] = str(task_id)
+        self._data["result"] = {
+            "type": obj_type._v,
+            "keys": [key.json() for key in keys],
+            "context": context if context is not None else {},
+        }
+
+
+def _jittered(interval: float, jitter: float) -> float:
+    return interval + random.uniform(0, jitter * interval)
+
+
+class _PopCoalescer:
+    # Sends concurrent pops as one request. Pops made while the request
+    # is in flight wait for it and are sent together afterwards.
+    def __init__(self, pop: Callable[[int], Awaitable[List[TaskQueueItemView]]]):
+        self._pop = pop
+        self._waiters: List[Tuple[int, asyncio.Future]] = []
+        self._sender: Optional[asyncio.Future] = None
+        # Tasks popped for pops cancelled while their request was in flight.
+        # They are already executing, so they're given to the next pops.
+        self._leftover: List[TaskQueueItemView] = []
+
+    async def pop(self, limit: int) -> List[TaskQueueItemView]:
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append((limit, waiter))
+        if self._sender is None:
+            self._sender = asyncio.ensure_future(self._send())
+        return await waiter
+
+    async def _send(self) -> None:
+        try:
+            while self._waiters:
+                waiters, self._waiters = self._waiters, []
+                # Cancelled pops don't take tasks.
+                waiters = [(limit, w) for limit, w in waiters if not w.done()]
+                waiters = self._give_leftover(waiters)
+                batches = _pop_batches(waiters)
+                await asyncio.gather(*(self._send_batch(b) for b in batches))
+        finally:
+            self._sender = None
+            for _, waiter in self._waiters:
+                waiter.cancel()
+            self._waiters.clear()
+
+    def _give_leftover(
+        self, waiters: List[Tuple[int, asyncio.Future]]
+    ) -> List[Tuple[int, asyncio.Future]]:
+        # Returns pops left without tasks.
+        rest = []
+        for limit, waiter in waiters:
+            if not self._leftover:
+                rest.append((limit, waiter))
+                continue
+            waiter.set_result(self._leftover[:limit])
+            del self._leftover[:limit]
+        return rest
+
+    async def _send_batch(self, waiters: List[Tuple[int, asyncio.Future]]) -> None:
+        try:
+            tasks = await self._pop(sum(limit for limit, _ in waiters))
+        except Exception as exp:
+            # The error is given only to pops of the failed request.
+            for _, waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(exp)
+            return
+        except BaseException:
+            for _, waiter in waiters:
+                waiter.cancel()
+            raise
+
+        start = 0
+        for limit, waiter in waiters:
+            if waiter.done():
+                continue
+            end = start + limit
+            waiter.set_result(tasks[start:end])
+            start = end
+        self._leftover += tasks[start:]
+
+
+def _pop_batches(
+    waiters: List[Tuple[int, asyncio.Future]]
+) -> List[List[Tuple[int, asyncio.Future]]]:
+    # Pops are split into requests of at most the API maximum limit,
+    # a pop of a larger limit is sent alone.
+    batches: List[List[Tuple[int, asyncio.Future]]] = []
+    batch_limit = 0
+    for limit, waiter in waiters:
+        if not batches or batch_limit + limit > _MAX_POP_LIMIT:
+            batches.append([])
+            batch_limit = 0
+        batches[-1].append((limit, waiter))
+        batch_limit += limit
+    return batches
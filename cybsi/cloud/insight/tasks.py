@@ -1,9 +1,7 @@
 import uuid
 from typing import Iterable, List, Optional, cast
 
-from enum_tools import document_enum
-
-from ..enum import CybsiAPIEnum
+from ..enum import CybsiAPIEnum, document_enum
 from ..internal import BaseAPI, BaseAsyncAPI, JsonObject, JsonObjectForm, JsonObjectView
 
 _PATH = "/insight/tasks"
@@ -70,7 +68,11 @@ class TaskAPI(BaseAPI):
             Too many requests error codes specific for this method:
               * :attr:`~cybsi.cloud.error.TooManyRequestsErrorCodes.LimitExceeded`
         """
-        resp = self._connector.do_post(path=_PATH, json=task.json())
+        resp = self._connector.do_post(
+            path=_PATH,
+            content=task.serialized_json(),
+            headers={"Content-Type": "application/json"},
+        )
         return TaskRegistrationView(resp.json())
 
     def view(self, task_id: uuid.UUID) -> "TaskView":
@@ -117,7 +119,11 @@ class TaskAsyncAPI(BaseAsyncAPI):
             Too many requests error codes specific for this method:
               * :attr:`~cybsi.cloud.error.TooManyRequestsErrorCodes.LimitExceeded`
         """
-        resp = await self._connector.do_post(path=_PATH, json=task.json())
+        resp = await self._connector.do_post(
+            path=_PATH,
+            content=task.serialized_json(),
+            headers={"Content-Type": "application/json"},
+        )
         return TaskRegistrationView(resp.json())
 
     async def view(self, task_id: uuid.UUID) -> "TaskView":
@@ -237,7 +243,7 @@ class ObjectKeyForm(JsonObjectForm):
 
     def __init__(self, key_type: ObjectKeyType, value: str):
         super().__init__()
-        self._data["type"] = key_type.value
+        self._data["type"] = key_type._v
         self._data["value"] = value
 
 
@@ -2,9 +2,9 @@
 Base internal classes, useful to simplify API implementation.
 """
 
-import json
 from typing import Any, Callable, Dict, List, Optional, TypeVar
 
+from .._json import json_dumps, json_encode
 from ..error import CybsiError
 from .connector import AsyncHTTPConnector, HTTPConnector
 
@@ -26,20 +26,41 @@ class BaseAsyncAPI:
 class JsonObjectForm:
     def __init__(self, data: Optional[JsonObject] = None):
         self._data = data or {}
+        self._serialized: Optional[bytes] = None
 
     def __str__(self):
-        return json.dumps(self._data, indent=2)
+        return json_dumps(self._data)
+
+    def pretty(self) -> str:
+        """Returns JSON representation indented by 2 spaces."""
+        return json_dumps(self._data, indent=True)
 
     def json(self):
         return self._data
 
+    def serialized_json(self) -> bytes:
+        """Returns the form encoded as JSON document.
+
+        The document is encoded on the first call and kept
+        for forms sent several times. The form and data it holds,
+        like dicts returned by :meth:`json`, must not be changed after that,
+        otherwise the kept document is sent.
+        """
+        if self._serialized is None:
+            self._serialized = json_encode(self._data)
+        return self._serialized
+
 
 class JsonObjectView:
     def __init__(self, data: Optional[JsonObject] = None):
         self._data = data or {}
 
     def __str__(self):
-        return json.dumps(self._data, indent=2)
+        return json_dumps(self._data)
+
+    def pretty(self) -> str:
+        """Returns JSON representation indented by 2 spaces."""
+        return json_dumps(self._data, indent=True)
 
     def _get(self, key):
         try:
@@ -1,5 +1,5 @@
 import io
-from typing import Protocol
+from typing import Optional, Protocol
 
 _DEFAULT_BUF_SIZE = 65536
 
@@ -25,14 +25,13 @@ class BufferedReader:
 
     def __init__(self, source: BytesReader, *, size: int):
         self._source = source
-        self._buf = io.BytesIO()
+        # Data is appended to the end and taken from the start
+        # of the buffer, neither moves the buffered data.
+        self._buf = bytearray()
         self._buf_size = size
-        self._r = 0  # read position
-        self._w = 0  # write position
-
-    @property
-    def _buffered(self) -> int:
-        return self._w - self._r
+        # The last peeked data and its requested size, kept until the buffer changes.
+        self._peeked: Optional[bytes] = None
+        self._peeked_n = 0
 
     def _readall(self) -> bytes:
         result = io.BytesIO(b"")
@@ -54,13 +53,12 @@ class BufferedReader:
         if n <= 0:
             return self._readall()
 
-        if self._buffered == 0:
+        self._peeked = None
+        if not self._buf:
             return self._source.read(n)
 
-        chunk = self._buf.read(min(n, self._buffered))
-        self._r += len(chunk)
-
-        if self._buffered == 0 and len(chunk) < n:
+        chunk = take(self._buf, n)
+        if not self._buf and len(chunk) < n:
             rest = n - len(chunk)
             chunk += self._source.read(rest)
 
@@ -79,40 +77,18 @@ class BufferedReader:
             return b""
 
         n = self._buf_size if n > self._buf_size else n
+        if self._peeked is not None and self._peeked_n == n:
+            return self._peeked
 
-        buffered: int = self._buffered
-        if buffered >= n:
-            # enough data in buffer.
-            start, end = self._r, self._r + n
-            return bytes(self._buf.getbuffer()[start:end])
-
-        pos = buffered
-        if self._r == self._w:
-            # buffer is read, reset buffer.
-            self._r, self._w = 0, 0
-            pos = 0
-        if self._r > 0:
-            # move non-read data to the zero position
-            view = self._buf.getbuffer()
-            start, end = self._r, self._w
-            view[0:pos] = view[start:end]
-            # delete the memory view object otherwise
-            # it would be impossible to write to the buffer
-            del view
-            self._r, self._w = 0, pos
-        self._buf.seek(pos)
-
-        while (rest := n - self._buffered) > 0:
+        while (rest := n - len(self._buf)) > 0:
             chunk_size = min(_DEFAULT_BUF_SIZE, rest)
             chunk = self._source.read(chunk_size)
             if not chunk:
                 break
-            self._buf.write(chunk)
-            self._w += len(chunk)
+            self._buf += chunk
 
-        self._buf.seek(0)
-        start, end = self._r, self._w
-        return bytes(self._buf.getbuffer()[start:end])
+        self._peeked, self._peeked_n = _head(self._buf, n), n
+        return self._peeked
 
 
 class AsyncBufferedReader:
@@ -120,14 +96,13 @@ class AsyncBufferedReader:
 
     def __init__(self, source: AsyncBytesReader, *, size: int):
         self._source = source
-        self._buf = io.BytesIO()
+        # Data is appended to the end and taken from the start
+        # of the buffer, neither moves the buffered data.
+        self._buf = bytearray()
         self._buf_size = size
-        self._r = 0  # read position
-        self._w = 0  # write position
-
-    @property
-    def _buffered(self) -> int:
-        return self._w - self._r
+        # The last peeked data and its requested size, kept until the buffer changes.
+        self._peeked: Optional[bytes] = None
+        self._peeked_n = 0
 
     async def _readall(self) -> bytes:
         result = io.BytesIO(b"")
@@ -149,13 +124,12 @@ class AsyncBufferedReader:
         if n <= 0:
             return await self._readall()
 
-        if self._buffered == 0:
+        self._peeked = None
+        if not self._buf:
             return await self._source.read(n)
 
-        chunk = self._buf.read(min(n, self._buffered))
-        self._r += len(chunk)
-
-        if self._buffered == 0 and len(chunk) < n:
+        chunk = take(self._buf, n)
+        if not self._buf and len(chunk) < n:
             rest = n - len(chunk)
             chunk += await self._source.read(rest)
 
@@ -174,40 +148,18 @@ class AsyncBufferedReader:
             return b""
 
         n = self._buf_size if n > self._buf_size else n
+        if self._peeked is not None and self._peeked_n == n:
+            return self._peeked
 
-        buffered: int = self._buffered
-        if buffered >= n:
-            # enough data in buffer.
-            start, end = self._r, self._r + n
-            return bytes(self._buf.getbuffer()[start:end])
-
-        pos = buffered
-        if self._r == self._w:
-            # buffer is read, reset buffer.
-            self._r, self._w = 0, 0
-            pos = 0
-        if self._r > 0:
-            # move non-read data to the zero position.
-            view = self._buf.getbuffer()
-            start, end = self._r, self._w
-            view[0:pos] = view[start:end]
-            # delete the memory view object otherwise
-            # it would be impossible to write to the buffer
-            del view
-            self._r, self._w = 0, pos
-        self._buf.seek(pos)
-
-        while (rest := n - self._buffered) > 0:
+        while (rest := n - len(self._buf)) > 0:
             chunk_size = min(_DEFAULT_BUF_SIZE, rest)
             chunk = await self._source.read(chunk_size)
             if not chunk:
                 break
-            self._buf.write(chunk)
-            self._w += len(chunk)
+            self._buf += chunk
 
-        self._buf.seek(0)
-        start, end = self._r, self._w
-        return bytes(self._buf.getbuffer()[start:end])
+        self._peeked, self._peeked_n = _head(self._buf, n), n
+        return self._peeked
 
 
 class LimitedReader:
@@ -219,12 +171,19 @@ class LimitedReader:
         self._byte_read = 0
 
     def _readall(self) -> bytes:
-        result = io.BytesIO(b"")
-        chunk = self.read(_DEFAULT_BUF_SIZE)
-        while chunk:
-            result.write(chunk)
-            chunk = self.read(_DEFAULT_BUF_SIZE)
-        return result.getvalue()
+        # The rest size is known, so usually it's read by a single call.
+        if self._byte_read == self._limit:
+            return b""
+        chunk = self.read(self._limit - self._byte_read)
+        if not chunk or self._byte_read == self._limit:
+            return chunk
+        result = bytearray(chunk)
+        while self._byte_read < self._limit:
+            chunk = self.read(self._limit - self._byte_read)
+            if not chunk:
+                break
+            result += chunk
+        return bytes(result)
 
     def read(self, n: int = -1) -> bytes:
         """Read at most n bytes from the source.
@@ -257,12 +216,19 @@ class AsyncLimitedReader:
         self._byte_read = 0
 
     async def _readall(self) -> bytes:
-        result = io.BytesIO(b"")
-        chunk = await self.read(_DEFAULT_BUF_SIZE)
-        while chunk:
-            result.write(chunk)
-            chunk = await self.read(_DEFAULT_BUF_SIZE)
-        return result.getvalue()
+        # The rest size is known, so usually it's read by a single call.
+        if self._byte_read == self._limit:
+            return b""
+        chunk = await self.read(self._limit - self._byte_read)
+        if not chunk or self._byte_read == self._limit:
+            return chunk
+        result = bytearray(chunk)
+        while self._byte_read < self._limit:
+            chunk = await self.read(self._limit - self._byte_read)
+            if not chunk:
+                break
+            result += chunk
+        return bytes(result)
 
     async def read(self, n: int = -1) -> bytes:
         """Read at most n bytes from the source.
@@ -284,3 +250,21 @@ class AsyncLimitedReader:
         chunk = await self._source.read(n)
         self._byte_read += len(chunk)
         return chunk
+
+
+def take(buffer: bytearray, n: int) -> bytes:
+    """Remove at most n bytes from the start of the buffer and return them.
+
+    Deleting from the start of bytearray is cheap,
+    the rest of the data is not moved.
+    """
+    with memoryview(buffer) as view:
+        result = bytes(view[:n])
+    del buffer[:n]
+    return result
+
+
+def _head(buffer: bytearray, n: int) -> bytes:
+    # Copy the data once, slicing bytearray would copy it twice.
+    with memoryview(buffer) as view:
+        return bytes(view[:n])
@@ -0,0 +1,51 @@
+"""
+In-memory cache of API responses.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+import httpx
+
+_DEFAULT_MAX_SIZE = 256
+
+
+class ResponseCache:
+    # LRU cache of successful GET responses with per-entry TTL.
+    # Expired entries are kept until evicted,
+    # so they can be served when API is temporarily unavailable.
+
+    def __init__(self, max_size: int = _DEFAULT_MAX_SIZE):
+        self._entries: "OrderedDict[Hashable, Tuple[float, httpx.Response]]" = (
+            OrderedDict()
+        )
+        self._max_size = max_size
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(path: str, params: dict) -> Hashable:
+        return path, tuple(sorted(params.items()))
+
+    def get(self, key: Hashable, *, allow_expired=False) -> Optional[httpx.Response]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, resp = entry
+            if not allow_expired and time.monotonic() >= expires_at:
+                return None
+            self._entries.move_to_end(key)
+            return resp
+
+    def put(self, key: Hashable, resp: httpx.Response, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, resp)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -7,9 +7,11 @@ import httpx
 
 from cybsi.cloud.__version__ import __version__
 
+from .._json import json_encode
 from ..api import Tag
-from ..error import CybsiError, _raise_cybsi_error
+from ..error import APIError, CybsiError, _raise_cybsi_error
 from ..internal.multipart import apply_async_multipart_stream
+from .cache import ResponseCache
 
 _BASIC_HEADERS = {
     "User-Agent": f"cybsi-cloud-client/v{__version__}",
@@ -22,6 +24,18 @@ _IDEMPOTENT_HTTP_METHODS = ["GET", "HEAD", "PUT", "DELETE", "OPTIONS"]
 apply_async_multipart_stream()
 
 
+def _encode_json(kwargs: dict) -> None:
+    # JSON body is encoded here instead of httpx to use orjson if it's installed.
+    body = kwargs.pop("json", None)
+    if body is None:
+        return
+    kwargs["content"] = json_encode(body)
+    kwargs["headers"] = {
+        **(kwargs.get("headers") or {}),
+        "Content-Type": "application/json",
+    }
+
+
 class HTTPConnector:
     """Connector performing round trips to Cybsi Cloud."""
 
@@ -33,6 +47,9 @@ class HTTPConnector:
         timeouts,
         limits,
         retry,
+        cache_enabled: bool = False,
+        cache_stale_on_error: bool = False,
+        http2: bool = False,
     ):
         self._client = httpx.Client(
             auth=auth,
@@ -41,8 +58,11 @@ class HTTPConnector:
             headers=_BASIC_HEADERS,
             timeout=timeouts._as_httpx_timeouts(),
             limits=limits._as_httpx_limits(),
+            http2=http2,
         )
         self._retry = retry
+        self._cache = ResponseCache() if cache_enabled else None
+        self._cache_stale_on_error = cache_stale_on_error
 
     def __enter__(self) -> "HTTPConnector":
         self._client.__enter__()
@@ -61,11 +81,42 @@ class HTTPConnector:
         self._client.close()
 
     def do_get(
-        self, path: str, params: Optional[dict] = None, stream=False, **kwargs
+        self,
+        path: str,
+        params: Optional[dict] = None,
+        stream=False,
+        cache_ttl: Optional[float] = None,
+        **kwargs,
     ) -> httpx.Response:
+        """Do GET request.
+
+        If cache_ttl (in seconds) is set, the response is cached
+        and served from cache until TTL expires.
+        If enabled by cache_stale_on_error, expired response is also served
+        if API is unavailable.
+        """
         if params is None:
             params = {}
-        return self._do("GET", path, params=params, stream=stream, **kwargs)
+        if cache_ttl is None or stream or self._cache is None:
+            return self._do("GET", path, params=params, stream=stream, **kwargs)
+
+        key = ResponseCache.make_key(path, params)
+        resp = self._cache.get(key)
+        if resp is not None:
+            return resp
+        try:
+            resp = self._do("GET", path, params=params, **kwargs)
+        except APIError:
+            raise
+        except CybsiError:
+            if not self._cache_stale_on_error:
+                raise
+            stale = self._cache.get(key, allow_expired=True)
+            if stale is None:
+                raise
+            return stale
+        self._cache.put(key, resp, cache_ttl)
+        return resp
 
     def do_post(self, path: str, json: Any = None, **kwargs) -> httpx.Response:
         return self._do("POST", path, json=json, **kwargs)
@@ -106,6 +157,12 @@ class HTTPConnector:
             :class:`~cybsi.cloud.error.CybsiError`: On connectivity issues.
             :class:`~cybsi.cloud.error.APIError`: If response status code is >= 400
         """
+        if self._cache is not None and method not in ("GET", "HEAD"):
+            # Cached responses may be affected by any modification.
+            self._cache.clear()
+
+        has_json = bool(kwargs.get("json"))
+        _encode_json(kwargs)
         req = self._client.build_request(method, url=path, **kwargs)
 
         def send_request():
@@ -114,7 +171,7 @@ class HTTPConnector:
                 or method not in _IDEMPOTENT_HTTP_METHODS
                 or (
                     method == "PUT"
-                    and not kwargs.get("json")  # can retry PUT only if body is json.
+                    and not has_json  # can retry PUT only if body is json.
                 )
             ):
                 return self._client.send(request=req, stream=stream)
@@ -158,6 +215,7 @@ class AsyncHTTPConnector:
         timeouts,
         limits,
         retry,
+        http2: bool = False,
     ):
         self._client = httpx.AsyncClient(
             auth=auth,
@@ -166,6 +224,7 @@ class AsyncHTTPConnector:
             headers=_BASIC_HEADERS,
             timeout=timeouts._as_httpx_timeouts(),
             limits=limits._as_httpx_limits(),
+            http2=http2,
         )
         self._retry = retry
 
@@ -231,6 +290,8 @@ class AsyncHTTPConnector:
             :class:`~cybsi.cloud.error.CybsiError`: On connectivity issues.
             :class:`~cybsi.cloud.error.APIError`: If response status code is >= 400
         """
+        has_json = bool(kwargs.get("json"))
+        _encode_json(kwargs)
         req = self._client.build_request(method, url=path, **kwargs)
 
         async def do():
@@ -239,7 +300,7 @@ class AsyncHTTPConnector:
                 or method not in _IDEMPOTENT_HTTP_METHODS
                 or (
                     method == "PUT"
-                    and not kwargs.get("json")  # can retry PUT only if body is json.
+                    and not has_json  # can retry PUT only if body is json.
                 )
             ):
                 return await self._client.send(request=req, stream=stream)
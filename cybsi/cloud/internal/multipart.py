@@ -37,7 +37,8 @@ class AsyncAwareMultipartStream(MultipartStream):
                 field.file, AsyncStreamWrapper
             ):
                 yield field.render_headers()
-                chunk_size = 4096
+                # Same chunk size as httpx uses for synchronous file fields.
+                chunk_size = FileField.CHUNK_SIZE
                 while chunk := (await field.file.stream.read(chunk_size)):
                     yield chunk
             else:
@@ -1,4 +1,5 @@
 import datetime
+import sys
 
 
 def rfc3339_timestamp(dt: datetime.datetime) -> str:
@@ -18,8 +19,23 @@ def rfc3339_timestamp(dt: datetime.datetime) -> str:
     return timestamp
 
 
-def parse_rfc3339_timestamp(ts: str) -> datetime.datetime:
+def _strptime_rfc3339_timestamp(ts: str) -> datetime.datetime:
     if ts.find(".") != -1:
         return datetime.datetime.strptime(ts, "%Y-%m-%dT%H:%M:%S.%fZ")
     else:
         return datetime.datetime.strptime(ts, "%Y-%m-%dT%H:%M:%SZ")
+
+
+if sys.version_info >= (3, 11):
+
+    def parse_rfc3339_timestamp(ts: str) -> datetime.datetime:
+        # Since Python 3.11 fromisoformat accepts RFC 3339 timestamps
+        # and is much faster than strptime.
+        if ts[-1:] in ("Z", "z"):
+            # Strip the UTC designator to return naive datetime
+            # exactly like strptime does.
+            return datetime.datetime.fromisoformat(ts[:-1])
+        return _strptime_rfc3339_timestamp(ts)
+
+else:
+    parse_rfc3339_timestamp = _strptime_rfc3339_timestamp
@@ -35,7 +35,11 @@ class CollectionAPI(BaseAPI):
             Semantic error codes specific for this method:
             * :attr:`~cybsi.cloud.error.SemanticErrorCodes.SchemaNotFound`
         """
-        resp = self._connector.do_post(_PATH, json=collection.json())
+        resp = self._connector.do_post(
+            _PATH,
+            content=collection.serialized_json(),
+            headers={"Content-Type": "application/json"},
+        )
         return CollectionRegistrationView(resp.json())
 
     def view(self, collection_id: str) -> "CollectionView":
@@ -158,7 +162,11 @@ class CollectionAsyncAPI(BaseAsyncAPI):
             Semantic error codes specific for this method:
             * :attr:`~cybsi.cloud.error.SemanticErrorCodes.SchemaNotFound`
         """
-        resp = await self._connector.do_post(_PATH, json=collection.json())
+        resp = await self._connector.do_post(
+            _PATH,
+            content=collection.serialized_json(),
+            headers={"Content-Type": "application/json"},
+        )
         return CollectionRegistrationView(resp.json())
 
     async def view(self, collection_id: str) -> "CollectionView":
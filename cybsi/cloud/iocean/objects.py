@@ -2,9 +2,8 @@ from typing import Iterable, List, Optional, Tuple, cast
 from urllib.parse import parse_qs, urlparse
 
 import httpx
-from enum_tools import document_enum
 
-from ..enum import CybsiAPIEnum
+from ..enum import CybsiAPIEnum, document_enum
 from ..internal import BaseAPI, BaseAsyncAPI, JsonObject, JsonObjectView
 from ..pagination import AsyncPage, Cursor, Page
 
@@ -5,6 +5,8 @@ See Also:
     See :ref:`pagination-example`
     for complete examples of pagination usage.
 """
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import (
     AsyncIterator,
     Callable,
@@ -20,6 +22,8 @@ from urllib.parse import parse_qs, urlparse
 
 import httpx
 
+from ._json import json_loads
+
 
 class Cursor:
     """Page cursor value.
@@ -76,7 +80,19 @@ class _BasePage(Generic[T]):
         return list(iter(self))
 
     def __iter__(self) -> Iterator[T]:
-        yield from (self._view(x) for x in self._resp.json())
+        yield from (self._view(x) for x in json_loads(self._resp.content))
+
+
+_prefetch_executor: Optional[ThreadPoolExecutor] = None
+_prefetch_executor_lock = threading.Lock()
+
+
+def _submit_prefetch(fn: Callable[..., httpx.Response], link: str) -> Future:
+    global _prefetch_executor
+    with _prefetch_executor_lock:
+        if _prefetch_executor is None:
+            _prefetch_executor = ThreadPoolExecutor(thread_name_prefix="cybsi-prefetch")
+    return _prefetch_executor.submit(fn, link)
 
 
 class Page(_BasePage[T]):
@@ -87,6 +103,11 @@ class Page(_BasePage[T]):
         api_call: Callable object for getting next page
         resp: Response which represents a start page
         view: View class for page elements
+        prefetch: Request the next page in background thread
+            while the current page is processed.
+            The request is sent when the page is built, so one page
+            more than needed is requested if the caller stops early.
+            :func:`chain_pages` cancels the request if it isn't sent yet.
     """
 
     def __init__(
@@ -94,9 +115,15 @@ class Page(_BasePage[T]):
         api_call: Callable[..., httpx.Response],
         resp: httpx.Response,
         view: Callable[..., T],
+        *,
+        prefetch: bool = False,
     ):
         super().__init__(resp, view)
         self._api_call = api_call
+        self._prefetch = prefetch
+        self._next: Optional[Future] = None
+        if prefetch and self.next_link is not None:
+            self._next = _submit_prefetch(api_call, self.next_link)
 
     def next_page(self) -> "Optional[Page[T]]":
         """Get next page.
@@ -105,7 +132,11 @@ class Page(_BasePage[T]):
         if self.next_link is None:
             return None
 
-        return Page(self._api_call, self._api_call(self.next_link), self._view)
+        if self._next is not None:
+            resp = self._next.result()
+        else:
+            resp = self._api_call(self.next_link)
+        return Page(self._api_call, resp, self._view, prefetch=self._prefetch)
 
 
 class AsyncPage(_BasePage[T]):
@@ -141,9 +172,14 @@ def chain_pages(start_page: Page[T]) -> Iterator[T]:
     """Get chain of collection objects."""
 
     page: Optional[Page[T]] = start_page
-    while page:
-        yield from page
-        page = page.next_page()
+    try:
+        while page:
+            yield from page
+            page = page.next_page()
+    finally:
+        # The next page prefetched for the page iteration stopped at isn't needed.
+        if page is not None and page._next is not None:
+            page._next.cancel()
 
 
 async def chain_pages_async(start_page: AsyncPage[T]) -> AsyncIterator[T]:
@@ -20,4 +20,4 @@ if __name__ == "__main__":
 
         for obj in chain_pages(start_page):
             # Do something with the object.
-            print(obj)
+            print(obj.pretty())
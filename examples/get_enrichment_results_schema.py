@@ -12,4 +12,4 @@ if __name__ == "__main__":
         schema_view = client.insight.schemas.view(schema_id="example-schema")
 
         # Do something with the schema as SchemaView.
-        print(schema_view)
+        print(schema_view.pretty())
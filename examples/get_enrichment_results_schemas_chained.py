@@ -11,4 +11,4 @@ if __name__ == "__main__":
 
         for schema in chain_pages(start_page):
             # Do something with the schema as SchemaCommonView.
-            print(schema)
+            print(schema.pretty())
@@ -0,0 +1,178 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from cybsi.cloud.auth import APIKeyAuth
+from cybsi.cloud.error import CybsiError
+
+_BASE_URL = "http://localhost"
+_HEADERS = {"X-Api-Version": "1", "User-Agent": "test"}
+
+
+class APIKeyAuthTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.token_requests = 0
+        self.api_requests = 0
+        self.expires_in = 3600
+
+    def _handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/auth/token":
+            self.token_requests += 1
+            assert request.headers["X-Api-Key"] == "key"
+            content = {
+                "accessToken": f"token{self.token_requests}",
+                "tokenType": "Bearer",
+                "expiresIn": self.expires_in,
+            }
+            return httpx.Response(200, json=content)
+
+        self.api_requests += 1
+        expected = f"Bearer token{self.token_requests}"
+        if request.headers.get("Authorization") != expected:
+            return httpx.Response(401, json={"code": "Unauthorized"})
+        return httpx.Response(200, json={})
+
+    def _make_client(self, auth: APIKeyAuth) -> httpx.Client:
+        return httpx.Client(
+            auth=auth,
+            base_url=_BASE_URL,
+            headers=_HEADERS,
+            transport=httpx.MockTransport(self._handler),
+        )
+
+    def test_token_is_reused(self):
+        auth = APIKeyAuth(api_url=_BASE_URL, api_key="key")
+        with self._make_client(auth) as client:
+            for _ in range(3):
+                assert client.get("/test").status_code == 200
+
+        assert self.token_requests == 1
+        assert self.api_requests == 3
+
+    def test_expired_token_is_refreshed_before_request(self):
+        auth = APIKeyAuth(api_url=_BASE_URL, api_key="key")
+        with self._make_client(auth) as client:
+            assert client.get("/test").status_code == 200
+            with patch("time.monotonic", return_value=self.expires_in + 1e9):
+                assert client.get("/test").status_code == 200
+
+        assert self.token_requests == 2
+        # no request was sent with the expired token.
+        assert self.api_requests == 2
+
+    def test_rejected_token_is_refreshed(self):
+        auth = APIKeyAuth(api_url=_BASE_URL, api_key="key")
+        with self._make_client(auth) as client:
+            assert client.get("/test").status_code == 200
+            auth._token = "Bearer revoked"
+            assert client.get("/test").status_code == 200
+
+        assert self.token_requests == 2
+
+    def test_rejected_token_is_not_retried(self):
+        auth = APIKeyAuth(api_url=_BASE_URL, api_key="key", retry_unauthorized=False)
+        with self._make_client(auth) as client:
+            assert client.get("/test").status_code == 200
+            auth._token = "Bearer revoked"
+            assert client.get("/test").status_code == 401
+
+        assert self.token_requests == 1
+
+
+class AsyncAPIKeyAuthTest(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_requests_share_token_refresh(self):
+        token_requests = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal token_requests
+            if request.url.path == "/auth/token":
+                token_requests += 1
+                await asyncio.sleep(0.01)
+                content = {
+                    "accessToken": "token",
+                    "tokenType": "Bearer",
+                    "expiresIn": 3600,
+                }
+                return httpx.Response(200, json=content)
+
+            assert request.headers["Authorization"] == "Bearer token"
+            return httpx.Response(200, json={})
+
+        auth = APIKeyAuth(api_url=_BASE_URL, api_key="key")
+        async with httpx.AsyncClient(
+            auth=auth,
+            base_url=_BASE_URL,
+            headers=_HEADERS,
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            responses = await asyncio.gather(*(client.get("/test") for _ in range(5)))
+
+        assert all(r.status_code == 200 for r in responses)
+        assert token_requests == 1
+
+    async def test_waiters_repeat_failed_refresh(self):
+        token_requests = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal token_requests
+            if request.url.path == "/auth/token":
+                token_requests += 1
+                await asyncio.sleep(0.01)
+                if token_requests == 1:
+                    return httpx.Response(500, json={"code": "InternalError"})
+                content = {
+                    "accessToken": "token",
+                    "tokenType": "Bearer",
+                    "expiresIn": 3600,
+                }
+                return httpx.Response(200, json=content)
+
+            assert request.headers["Authorization"] == "Bearer token"
+            return httpx.Response(200, json={})
+
+        auth = APIKeyAuth(api_url=_BASE_URL, api_key="key")
+        async with httpx.AsyncClient(
+            auth=auth,
+            base_url=_BASE_URL,
+            headers=_HEADERS,
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            responses = await asyncio.gather(
+                *(client.get("/test") for _ in range(5)), return_exceptions=True
+            )
+
+        assert isinstance(responses[0], CybsiError)
+        assert all(r.status_code == 200 for r in responses[1:])
+        assert token_requests == 2
+
+    async def test_token_client_is_used_for_refresh(self):
+        token_requests = 0
+
+        async def token_handler(request: httpx.Request) -> httpx.Response:
+            nonlocal token_requests
+            token_requests += 1
+            assert request.url.path == "/auth/token"
+            content = {"accessToken": "token", "tokenType": "Bearer", "expiresIn": 60}
+            return httpx.Response(200, json=content)
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/test"
+            assert request.headers["Authorization"] == "Bearer token"
+            return httpx.Response(200, json={})
+
+        auth = APIKeyAuth(api_url=_BASE_URL, api_key="key")
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(token_handler)
+        ) as token_client, httpx.AsyncClient(
+            auth=auth,
+            base_url=_BASE_URL,
+            headers=_HEADERS,
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            auth.set_token_client(token_client)
+            resp = await client.get("/test")
+
+        assert resp.status_code == 200
+        assert token_requests == 1
@@ -61,6 +61,14 @@ class BufferedReaderTest(unittest.TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_repeated_peek(self):
+        buf = BufferedReader(io.BytesIO(b"testdata"), size=4)
+
+        peeked = buf.peek(4)
+        self.assertIs(peeked, buf.peek(4))
+        self.assertEqual(b"te", buf.read(2))
+        self.assertEqual(b"stda", buf.peek(4))
+
     def test_read_all_data(self):
         expected = b"testdata"
         size = 4
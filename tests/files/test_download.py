@@ -0,0 +1,308 @@
+import asyncio
+import gzip
+import os
+import re
+import tempfile
+import threading
+import time
+import uuid
+from unittest.mock import patch
+
+import httpx
+
+from cybsi.cloud.client_config import (
+    _DEFAULT_LIMITS,
+    _DEFAULT_RETRY_COUNT,
+    _DEFAULT_TIMEOUTS,
+)
+from cybsi.cloud.error import CybsiError, NotFoundError
+from cybsi.cloud.files import FilesAPI, FilesAsyncAPI
+from cybsi.cloud.files import files
+from cybsi.cloud.internal import AsyncHTTPConnector, HTTPConnector
+from tests import BaseAsyncTest, BaseTest
+
+_PART_SIZE = 10
+_CONTENT = bytes(range(256)) * 2
+
+
+def _make_part(path, headers, **kwargs) -> httpx.Response:
+    match = re.fullmatch(r"bytes=(\d+)-(\d+)", headers["Range"])
+    assert match is not None
+    start = int(match.group(1))
+    end = min(int(match.group(2)), len(_CONTENT) - 1)
+    return httpx.Response(
+        206,
+        headers={"Content-Range": f"bytes {start}-{end}/{len(_CONTENT)}"},
+        stream=httpx.ByteStream(_CONTENT[start : end + 1]),
+    )
+
+
+class _BrokenStream(httpx.SyncByteStream):
+    def __iter__(self):
+        yield b"broken"
+        raise httpx.ReadError("connection lost")
+
+
+@patch.object(files, "_MIN_PART_SIZE", 1)
+@patch.object(files, "_RETRY_DELAY", 0)
+class DownloadTest(BaseTest):
+    def setUp(self) -> None:
+        self.connector = HTTPConnector(
+            base_url="http://localhost",
+            auth=None,
+            ssl_verify=True,
+            timeouts=_DEFAULT_TIMEOUTS,
+            limits=_DEFAULT_LIMITS,
+            retry=_DEFAULT_RETRY_COUNT,
+        )
+        self.api = FilesAPI(self.connector)
+
+    def test_download(self):
+        for concurrency in (1, 4):
+            with patch.object(self.connector, "do_get", side_effect=_make_part):
+                with self.api.download(
+                    uuid.uuid4(), concurrency=concurrency, part_size=_PART_SIZE
+                ) as c:
+                    assert c.read() == _CONTENT
+
+    def test_close_stops_download(self):
+        with patch.object(self.connector, "do_get", side_effect=_make_part) as get:
+            with self.api.download(uuid.uuid4(), part_size=_PART_SIZE) as content:
+                assert content.read(1) == _CONTENT[:1]
+        # first part and parts downloaded ahead.
+        assert get.call_count < len(_CONTENT) // _PART_SIZE
+
+    def test_close_doesnt_wait_for_parts(self):
+        release = threading.Event()
+
+        def get(path, headers, stream=False, **kwargs):
+            if not headers["Range"].startswith(("bytes=0-", f"bytes={_PART_SIZE}-")):
+                # Parts downloaded ahead arrive after the content is closed.
+                release.wait(5)
+            return _make_part(path, headers)
+
+        try:
+            with patch.object(self.connector, "do_get", side_effect=get):
+                content = self.api.download(
+                    uuid.uuid4(), concurrency=4, part_size=_PART_SIZE
+                )
+                size = _PART_SIZE + 1
+                assert content.read(size) == _CONTENT[:size]
+                started = time.monotonic()
+                content.close()
+                assert time.monotonic() - started < 1
+        finally:
+            release.set()
+
+    def test_invalid_part_size(self):
+        for part_size in (0, files._MAX_PART_SIZE + 1):
+            with self.assertRaises(ValueError):
+                self.api.download(uuid.uuid4(), part_size=part_size)
+
+    def test_read_by_small_parts(self):
+        with patch.object(self.connector, "do_get", side_effect=_make_part):
+            with self.api.download(uuid.uuid4(), part_size=_PART_SIZE) as content:
+                actual = b"".join(iter(lambda: content.read(3), b""))
+        assert actual == _CONTENT
+
+    def test_read_across_parts(self):
+        size = _PART_SIZE + _PART_SIZE // 2
+        with patch.object(self.connector, "do_get", side_effect=_make_part):
+            with self.api.download(
+                uuid.uuid4(), concurrency=1, part_size=_PART_SIZE
+            ) as content:
+                assert content.read(size) == _CONTENT[:size]
+                assert content.read(size) == _CONTENT[size : size * 2]
+
+    def test_read_rest(self):
+        with patch.object(self.connector, "do_get", side_effect=_make_part):
+            with self.api.download(uuid.uuid4(), part_size=_PART_SIZE) as content:
+                head = content.read(3)
+                assert head + content.read() == _CONTENT
+
+    def test_download_part(self):
+        with patch.object(self.connector, "do_get", side_effect=_make_part):
+            with self.api.download_part(uuid.uuid4(), start=5, end=14) as content:
+                assert content.read(4) == _CONTENT[5:9]
+                assert content.read() == _CONTENT[9:15]
+
+    def test_download_part_encoded(self):
+        resp = httpx.Response(
+            206,
+            headers={"Content-Encoding": "gzip"},
+            stream=httpx.ByteStream(gzip.compress(_CONTENT)),
+        )
+        with patch.object(self.connector, "do_get", return_value=resp):
+            with self.api.download_part(uuid.uuid4(), start=0, end=1) as content:
+                assert content.read() == _CONTENT
+
+    def test_chunk_size_follows_reads(self):
+        resp = httpx.Response(206, stream=httpx.ByteStream(_CONTENT))
+        with files.FileContent.from_response(resp, buffer_size=4) as content:
+            assert content.read(16) == _CONTENT[:16]
+            assert content._chunk_size == 16
+            # The part chunks are 16 bytes, the rest is buffered.
+            assert content.read(2) == _CONTENT[16:18]
+            assert len(content._buffer) == 14
+
+    def test_readinto(self):
+        buf = bytearray(7)
+        with patch.object(self.connector, "do_get", side_effect=_make_part):
+            with self.api.download(uuid.uuid4(), part_size=_PART_SIZE) as content:
+                actual = bytearray()
+                while n := content.readinto(buf):
+                    actual += buf[:n]
+        assert actual == _CONTENT
+
+    def test_download_to_buffer(self):
+        size_resp = httpx.Response(200, headers={"Content-Length": str(len(_CONTENT))})
+        buf = bytearray(len(_CONTENT))
+        with patch.object(
+            self.connector, "do_get", side_effect=_make_part
+        ), patch.object(self.connector, "do_head", return_value=size_resp):
+            assert self.api.download_to_buffer(
+                uuid.uuid4(), buf, part_size=_PART_SIZE
+            ) == len(_CONTENT)
+            assert buf == _CONTENT
+
+            with self.assertRaises(ValueError):
+                self.api.download_to_buffer(
+                    uuid.uuid4(), bytearray(1), part_size=_PART_SIZE
+                )
+
+    def test_download_to_buffer_retry(self):
+        size_resp = httpx.Response(200, headers={"Content-Length": str(len(_CONTENT))})
+        failures = [CybsiError("unexpected response status code: 502")]
+
+        def get_part(*args, **kwargs):
+            # The first request fails, it's repeated.
+            if failures:
+                raise failures.pop()
+            return _make_part(*args, **kwargs)
+
+        buf = bytearray(len(_CONTENT))
+        with patch.object(self.connector, "do_get", side_effect=get_part), patch.object(
+            self.connector, "do_head", return_value=size_resp
+        ):
+            self.api.download_to_buffer(uuid.uuid4(), buf, part_size=_PART_SIZE)
+        assert buf == _CONTENT
+
+        not_found = NotFoundError(httpx.Response(404))
+        with patch.object(
+            self.connector, "do_get", side_effect=not_found
+        ) as get, patch.object(self.connector, "do_head", return_value=size_resp):
+            with self.assertRaises(NotFoundError):
+                self.api.download_to_buffer(
+                    uuid.uuid4(), buf, concurrency=1, part_size=_PART_SIZE
+                )
+        # API errors are not transient.
+        assert get.call_count == 1
+
+    def test_download_to(self):
+        size_resp = httpx.Response(200, headers={"Content-Length": str(len(_CONTENT))})
+        broken = [httpx.Response(206, stream=_BrokenStream())]
+
+        def get_part(*args, **kwargs):
+            # The first request breaks, it's repeated.
+            return broken.pop() if broken else _make_part(*args, **kwargs)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            dest = os.path.join(tmp, "file")
+            with patch.object(
+                self.connector, "do_get", side_effect=get_part
+            ), patch.object(self.connector, "do_head", return_value=size_resp):
+                size = self.api.download_to(uuid.uuid4(), dest, part_size=_PART_SIZE)
+            assert size == len(_CONTENT)
+            with open(dest, "rb") as f:
+                assert f.read() == _CONTENT
+
+
+@patch.object(files, "_MIN_PART_SIZE", 1)
+class AsyncDownloadTest(BaseAsyncTest):
+    async def test_download(self):
+        async def make_part(*args, **kwargs):
+            return _make_part(*args, **kwargs)
+
+        connector = AsyncHTTPConnector(
+            base_url="http://localhost",
+            auth=None,
+            ssl_verify=True,
+            timeouts=_DEFAULT_TIMEOUTS,
+            limits=_DEFAULT_LIMITS,
+            retry=_DEFAULT_RETRY_COUNT,
+        )
+        api = FilesAsyncAPI(connector)
+        for concurrency in (1, 4):
+            with patch.object(connector, "do_get", side_effect=make_part):
+                async with await api.download(
+                    uuid.uuid4(), concurrency=concurrency, part_size=_PART_SIZE
+                ) as content:
+                    assert await content.read() == _CONTENT
+
+        async def head(*args, **kwargs):
+            return httpx.Response(200, headers={"Content-Length": str(len(_CONTENT))})
+
+        buf = bytearray(len(_CONTENT))
+        with patch.object(connector, "do_get", side_effect=make_part), patch.object(
+            connector, "do_head", side_effect=head
+        ):
+            assert await api.download_to_buffer(
+                uuid.uuid4(), buf, part_size=_PART_SIZE
+            ) == len(_CONTENT)
+        assert buf == _CONTENT
+
+        with tempfile.TemporaryDirectory() as tmp:
+            dest = os.path.join(tmp, "file")
+            with patch.object(connector, "do_get", side_effect=make_part), patch.object(
+                connector, "do_head", side_effect=head
+            ):
+                size = await api.download_to(uuid.uuid4(), dest, part_size=_PART_SIZE)
+            assert size == len(_CONTENT)
+            with open(dest, "rb") as f:
+                assert f.read() == _CONTENT
+
+    async def test_download_error(self):
+        connector = AsyncHTTPConnector(
+            base_url="http://localhost",
+            auth=None,
+            ssl_verify=True,
+            timeouts=_DEFAULT_TIMEOUTS,
+            limits=_DEFAULT_LIMITS,
+            retry=_DEFAULT_RETRY_COUNT,
+        )
+        api = FilesAsyncAPI(connector)
+
+        async def get_part(path, headers, **kwargs):
+            if headers["Range"].startswith("bytes=0-"):
+                raise NotFoundError(httpx.Response(404))
+            await asyncio.sleep(0.01)
+            return _make_part(path, headers, **kwargs)
+
+        async def head(*args, **kwargs):
+            return httpx.Response(200, headers={"Content-Length": str(len(_CONTENT))})
+
+        buf = bytearray(len(_CONTENT))
+        with tempfile.TemporaryDirectory() as tmp, patch.object(
+            connector, "do_get", side_effect=get_part
+        ), patch.object(connector, "do_head", side_effect=head):
+            dest = os.path.join(tmp, "file")
+            with self.assertRaises(NotFoundError):
+                await api.download_to_buffer(uuid.uuid4(), buf, part_size=_PART_SIZE)
+            with self.assertRaises(NotFoundError):
+                await api.download_to(uuid.uuid4(), dest, part_size=_PART_SIZE)
+            await asyncio.sleep(0.05)
+            # Other parts are cancelled and don't write after the error.
+            assert buf == bytearray(len(_CONTENT))
+            with open(dest, "rb") as f:
+                assert f.read() == bytes(len(_CONTENT))
+
+
+class ContentRangeTest(BaseTest):
+    def test_parse(self):
+        assert files._parse_content_range("bytes 0-9/100") == (0, 9, 100)
+        assert files._parse_content_range(" bytes 10 - 19 / 100 ") == (10, 19, 100)
+
+    def test_invalid(self):
+        for header in ("items 0-9/100", "bytes 0-9/*", "bytes */100"):
+            with self.assertRaises(CybsiError):
+                files._parse_content_range(header)
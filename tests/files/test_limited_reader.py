@@ -12,6 +12,21 @@ class LimitedReaderTest(unittest.TestCase):
         actual = r.read()
         self.assertEqual(expected, actual)
 
+    def test_source_returns_short_reads(self):
+        class ShortReader:
+            def __init__(self, data: bytes):
+                self._buf = io.BytesIO(data)
+
+            def read(self, n: int = -1):
+                return self._buf.read(min(n, 3))
+
+        data = b"testdata"
+        r = LimitedReader(ShortReader(data), limit=7)
+
+        actual = r.read()
+        self.assertEqual(data[:7], actual)
+        self.assertEqual(b"", r.read())
+
     def test_limit_is_greater_than_data_size(self):
         expected = b'test'
         limit = len(expected) + 1
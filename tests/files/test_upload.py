@@ -0,0 +1,204 @@
+import gzip
+import io
+import tempfile
+import uuid
+from typing import Dict
+from unittest.mock import patch
+
+import httpx
+
+from cybsi.cloud.client_config import (
+    _DEFAULT_LIMITS,
+    _DEFAULT_RETRY_COUNT,
+    _DEFAULT_TIMEOUTS,
+)
+from cybsi.cloud.error import CybsiError, NotFoundError, TooManyRequestsError
+from cybsi.cloud.files import FilesAPI, FilesAsyncAPI, files
+from cybsi.cloud.internal import AsyncHTTPConnector, HTTPConnector
+from tests import BaseAsyncTest, BaseTest
+
+_PART_SIZE = 10
+_CONTENT = bytes(range(256)) * 2
+_FILE_ID = uuid.uuid4()
+
+
+def _post(path, **kwargs):
+    if path.endswith("/completed"):
+        return httpx.Response(200, json={"fileID": str(_FILE_ID)})
+    return httpx.Response(201, json={"sessionID": str(uuid.uuid4())})
+
+
+@patch.object(files, "_MIN_PART_SIZE", 1)
+@patch.object(files, "_RETRY_DELAY", 0)
+class UploadTest(BaseTest):
+    def setUp(self) -> None:
+        self.connector = HTTPConnector(
+            base_url="http://localhost",
+            auth=None,
+            ssl_verify=True,
+            timeouts=_DEFAULT_TIMEOUTS,
+            limits=_DEFAULT_LIMITS,
+            retry=_DEFAULT_RETRY_COUNT,
+        )
+        self.api = FilesAPI(self.connector)
+        self.parts: Dict[int, bytes] = {}
+
+    def _put(self, path, files, **kwargs):
+        self.parts[int(files["number"])] = files["filePart"].read()
+        return httpx.Response(204)
+
+    def test_upload_by_parts(self):
+        for concurrency in (1, 4):
+            self.parts.clear()
+            with patch.object(
+                self.connector, "do_post", side_effect=_post
+            ), patch.object(self.connector, "do_put", side_effect=self._put):
+                ref = self.api.upload(
+                    io.BytesIO(_CONTENT),
+                    name="test",
+                    concurrency=concurrency,
+                    part_size=_PART_SIZE,
+                )
+            assert ref.id == _FILE_ID
+            assert b"".join(self.parts[n] for n in sorted(self.parts)) == _CONTENT
+            assert len(self.parts) == len(_CONTENT) // _PART_SIZE + 1
+
+    def test_upload_file_by_parts(self):
+        with tempfile.TemporaryFile() as f:
+            f.write(b"header" + _CONTENT)
+            f.seek(len(b"header"))
+            with patch.object(
+                self.connector, "do_post", side_effect=_post
+            ), patch.object(self.connector, "do_put", side_effect=self._put):
+                ref = self.api.upload(f, name="test", part_size=_PART_SIZE)
+            assert ref.id == _FILE_ID
+            assert b"".join(self.parts[n] for n in sorted(self.parts)) == _CONTENT
+            # The file is read to the end like a stream.
+            assert f.read() == b""
+
+    def test_upload_compressed_file(self):
+        with tempfile.TemporaryFile() as f:
+            with gzip.GzipFile(fileobj=f, mode="wb") as gz:
+                gz.write(_CONTENT)
+            f.seek(0)
+            with gzip.GzipFile(fileobj=f, mode="rb") as gz, patch.object(
+                self.connector, "do_post", side_effect=_post
+            ), patch.object(self.connector, "do_put", side_effect=self._put):
+                self.api.upload(gz, name="test", part_size=_PART_SIZE)
+        # Decompressed data is uploaded, not the file content.
+        assert b"".join(self.parts[n] for n in sorted(self.parts)) == _CONTENT
+
+    def test_upload_part_retry(self):
+        failed = set()
+
+        def put(path, files, **kwargs):
+            # Each part fails once, it's sent again from the buffer.
+            number = int(files["number"])
+            if number not in failed:
+                failed.add(number)
+                files["filePart"].read(1)
+                raise CybsiError("could not send request")
+            return self._put(path, files, **kwargs)
+
+        with patch.object(self.connector, "do_post", side_effect=_post), patch.object(
+            self.connector, "do_put", side_effect=put
+        ):
+            self.api.upload(io.BytesIO(_CONTENT), name="test", part_size=_PART_SIZE)
+        assert b"".join(self.parts[n] for n in sorted(self.parts)) == _CONTENT
+
+    def test_upload_size_mismatch(self):
+        with tempfile.TemporaryFile() as f:
+            f.write(_CONTENT)
+            f.seek(0)
+            for data in (io.BytesIO(_CONTENT), f):
+                with patch.object(
+                    self.connector, "do_post", side_effect=_post
+                ) as post, patch.object(
+                    self.connector, "do_put", side_effect=self._put
+                ):
+                    with self.assertRaises(ValueError):
+                        self.api.upload(data, name="test", size=0, part_size=_PART_SIZE)
+                # The session isn't completed.
+                assert not any(
+                    c.kwargs["path"].endswith("/completed") for c in post.call_args_list
+                )
+
+    def test_retry_delay(self):
+        resp = httpx.Response(
+            429, headers={"Retry-After": "3600"}, json={"code": "LimitExceeded"}
+        )
+        limited = TooManyRequestsError(resp)
+        assert files._retry_delay(limited, 1) == files._MAX_RETRY_DELAY
+        assert files._retry_delay(limited, files._PART_ATTEMPTS) is None
+        assert files._retry_delay(CybsiError("could not send request"), 1) == 0
+        not_found = NotFoundError(httpx.Response(404, json={"code": "NotFound"}))
+        assert files._retry_delay(not_found, 1) is None
+
+    def test_upload_bytes(self):
+        resp = httpx.Response(201, json={"fileID": str(_FILE_ID)})
+        for data in (_CONTENT, bytearray(_CONTENT), memoryview(_CONTENT)):
+            with patch.object(self.connector, "do_put", return_value=resp) as put:
+                ref = self.api.upload(data, name="test")
+            assert ref.id == _FILE_ID
+            assert put.call_args.kwargs["files"] == {"file": ("test", _CONTENT)}
+
+    def test_iter_parts_of_known_size(self):
+        for part_size in (_PART_SIZE, 16):
+            parts = [
+                (part.read(), size)
+                for part, size in files._iter_parts(
+                    io.BytesIO(_CONTENT), part_size=part_size, total_size=len(_CONTENT)
+                )
+            ]
+            full, last = divmod(len(_CONTENT), part_size)
+            expected_sizes = [part_size] * full + ([last] if last else [])
+            assert [size for _, size in parts] == expected_sizes
+            assert b"".join(data for data, _ in parts) == _CONTENT
+
+
+@patch.object(files, "_MIN_PART_SIZE", 1)
+class AsyncUploadTest(BaseAsyncTest):
+    def setUp(self) -> None:
+        self.connector = AsyncHTTPConnector(
+            base_url="http://localhost",
+            auth=None,
+            ssl_verify=True,
+            timeouts=_DEFAULT_TIMEOUTS,
+            limits=_DEFAULT_LIMITS,
+            retry=_DEFAULT_RETRY_COUNT,
+        )
+        self.api = FilesAsyncAPI(self.connector)
+        self.parts: Dict[int, bytes] = {}
+
+    async def _post(self, path, **kwargs):
+        return _post(path, **kwargs)
+
+    async def _put(self, path, files, **kwargs):
+        part = files["filePart"]
+        self.parts[int(files["number"])] = await part.stream.read()
+        return httpx.Response(204)
+
+    async def test_upload_by_parts(self):
+        for concurrency in (1, 4):
+            self.parts.clear()
+            with patch.object(
+                self.connector, "do_post", side_effect=self._post
+            ), patch.object(self.connector, "do_put", side_effect=self._put):
+                ref = await self.api.upload(
+                    files._AsyncBufferReader(memoryview(_CONTENT)),
+                    name="test",
+                    concurrency=concurrency,
+                    part_size=_PART_SIZE,
+                )
+            assert ref.id == _FILE_ID
+            assert b"".join(self.parts[n] for n in sorted(self.parts)) == _CONTENT
+            assert len(self.parts) == len(_CONTENT) // _PART_SIZE + 1
+
+    async def test_upload_bytes(self):
+        async def put(*args, **kwargs):
+            assert kwargs["files"] == {"file": ("test", _CONTENT)}
+            return httpx.Response(201, json={"fileID": str(_FILE_ID)})
+
+        with patch.object(self.connector, "do_put", side_effect=put):
+            ref = await self.api.upload(bytearray(_CONTENT), name="test")
+        assert ref.id == _FILE_ID
@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from typing import List
 from unittest.mock import patch
@@ -7,6 +8,8 @@ from cybsi.cloud.internal import HTTPConnector, parse_rfc3339_timestamp, AsyncHT
 from cybsi.cloud.client_config import _DEFAULT_TIMEOUTS, _DEFAULT_LIMITS, _DEFAULT_RETRY_COUNT
 from cybsi.cloud.insight import TaskQueueAPI, TaskQueueItemView, ObjectKeyView, ObjectType, ObjectKeyForm, \
     ObjectKeyType, TaskQueueAsyncAPI
+from cybsi.cloud.error import CybsiError
+from cybsi.cloud.insight import TaskCompletionForm, task_queue
 from tests import BaseTest, BaseAsyncTest
 
 
@@ -63,6 +66,21 @@ class TaskQueueAPITest(BaseTest):
         assert actual_object_key.type.value == expected_object_key_type_str
         assert actual_object_key.value == expected_object_key_value
 
+    @patch.object(HTTPConnector, "do_post")
+    def test_pop_tasks_polling(self, mock):
+        task = {"id": str(uuid.uuid4()), "createdAt": "2023-12-07T05:11:03.024Z", "params": {}}
+        responses = [[], [], [], [task], []]
+
+        def side_effect(path, json):
+            return self._make_response(200, responses.pop(0))
+        mock.side_effect = side_effect
+
+        with patch.object(task_queue.time, "sleep") as sleep:
+            tasks = self.task_queue_api.pop_tasks_polling(limit=1, min_interval=1, max_interval=3, jitter=0)
+            assert next(tasks).id == uuid.UUID(task["id"])
+        # Delays of empty polls grow up to the maximum.
+        assert [c.args[0] for c in sleep.call_args_list] == [1, 2, 3]
+
     @patch.object(HTTPConnector, "do_post")
     def test_complete_task(self, mock):
         expected_task_id = uuid.UUID("e68c61ee-3bad-4eee-909b-8a95e482bcdd")
@@ -86,6 +104,17 @@ class TaskQueueAPITest(BaseTest):
             keys=[expected_object_key],
         )
 
+    @patch.object(HTTPConnector, "do_post")
+    def test_complete_task_by_str_id(self, mock):
+        task = TaskQueueItemView({"id": "e68c61ee-3bad-4eee-909b-8a95e482bcdd"})
+        assert task.id is task.id
+
+        def side_effect(path, json):
+            assert json["taskID"] == task.raw()["id"]
+        mock.side_effect = side_effect
+
+        self.task_queue_api.complete_task(task_id=task.raw()["id"], obj_type=ObjectType.URL, keys=[])
+
     @patch.object(HTTPConnector, "do_post")
     def test_fail_task(self, mock):
         expected_task_id = uuid.UUID("e68c61ee-3bad-4eee-909b-8a95e482bcdd")
@@ -192,3 +221,109 @@ class TaskQueueAsyncAPITest(BaseAsyncTest):
         mock.side_effect = side_effect
 
         await self.task_queue_api.fail_task(task_id=expected_task_id, code=expected_code, message=expected_message)
+
+    @patch.object(AsyncHTTPConnector, "do_post")
+    async def test_pop_tasks_coalesced(self, mock):
+        limits = [1, 2, 3]
+        task_ids = [str(uuid.uuid4()) for _ in range(5)]
+
+        async def side_effect(path, json):
+            # Concurrent pops are sent as a single request.
+            assert json["limit"] == sum(limits)
+            content = [
+                {"id": task_id, "createdAt": "2023-12-07T05:11:03.024Z", "params": {}}
+                for task_id in task_ids
+            ]
+            return await self._make_async_response(200, content)
+        mock.side_effect = side_effect
+
+        actual = await asyncio.gather(*(self.task_queue_api.pop_tasks(limit=limit) for limit in limits))
+        assert mock.call_count == 1
+        assert [[str(task.id) for task in tasks] for tasks in actual] == [
+            task_ids[:1], task_ids[1:3], task_ids[3:],
+        ]
+
+    @patch.object(AsyncHTTPConnector, "do_post")
+    async def test_complete_tasks(self, mock):
+        task_ids = [str(uuid.uuid4()) for _ in range(5)]
+        completed = []
+
+        async def side_effect(path, json):
+            completed.append(json["taskID"])
+            return await self._make_async_response(204, {})
+        mock.side_effect = side_effect
+
+        await self.task_queue_api.complete_tasks(
+            (TaskCompletionForm(task_id=task_id, obj_type=ObjectType.URL, keys=[]) for task_id in task_ids),
+            concurrency=2,
+        )
+        assert sorted(completed) == sorted(task_ids)
+
+    @patch.object(AsyncHTTPConnector, "do_post")
+    async def test_complete_tasks_stops_on_error(self, mock):
+        task_ids = [str(uuid.uuid4()) for _ in range(5)]
+        completed = []
+
+        async def side_effect(path, json):
+            if json["taskID"] == task_ids[0]:
+                raise CybsiError("failed")
+            await asyncio.sleep(0.01)
+            completed.append(json["taskID"])
+            return await self._make_async_response(204, {})
+        mock.side_effect = side_effect
+
+        with self.assertRaises(CybsiError):
+            await self.task_queue_api.complete_tasks(
+                (TaskCompletionForm(task_id=task_id, obj_type=ObjectType.URL, keys=[]) for task_id in task_ids),
+                concurrency=2,
+            )
+        # The registration sent concurrently with the failed one is cancelled,
+        # the rest are not sent.
+        assert mock.call_count == 2
+        assert completed == []
+
+    @patch.object(AsyncHTTPConnector, "do_post")
+    async def test_pop_tasks_cancelled(self, mock):
+        task_ids = [str(uuid.uuid4()) for _ in range(3)]
+        sent = asyncio.Event()
+        release = asyncio.Event()
+
+        async def side_effect(path, json):
+            sent.set()
+            await release.wait()
+            content = [
+                {"id": task_id, "createdAt": "2023-12-07T05:11:03.024Z", "params": {}}
+                for task_id in task_ids[:json["limit"]]
+            ]
+            return await self._make_async_response(200, content)
+        mock.side_effect = side_effect
+
+        cancelled = asyncio.ensure_future(self.task_queue_api.pop_tasks(limit=1))
+        pending = asyncio.ensure_future(self.task_queue_api.pop_tasks(limit=2))
+        await sent.wait()
+        cancelled.cancel()
+        release.set()
+
+        assert [str(task.id) for task in await pending] == task_ids[:2]
+        # The task popped for the cancelled call is given to the next call.
+        tasks = await self.task_queue_api.pop_tasks(limit=5)
+        assert [str(task.id) for task in tasks] == task_ids[2:]
+        assert mock.call_count == 1
+
+    @patch.object(task_queue, "_MAX_POP_LIMIT", 2)
+    @patch.object(AsyncHTTPConnector, "do_post")
+    async def test_pop_tasks_split(self, mock):
+        async def side_effect(path, json):
+            if json["limit"] == 1:
+                raise CybsiError("could not send request")
+            return await self._make_async_response(200, [])
+        mock.side_effect = side_effect
+
+        results = await asyncio.gather(
+            *(self.task_queue_api.pop_tasks(limit=1) for _ in range(3)), return_exceptions=True,
+        )
+        # Coalesced calls exceeding the maximum limit are sent by two requests,
+        # the error is given only to the call of the failed one.
+        assert sorted(call.kwargs["json"]["limit"] for call in mock.call_args_list) == [1, 2]
+        assert results[:2] == [[], []]
+        assert isinstance(results[2], CybsiError)
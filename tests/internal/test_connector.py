@@ -0,0 +1,127 @@
+from unittest.mock import patch
+
+import httpx
+
+from cybsi.cloud._json import json_loads
+from cybsi.cloud.client_config import (
+    _DEFAULT_LIMITS,
+    _DEFAULT_RETRY_COUNT,
+    _DEFAULT_TIMEOUTS,
+)
+from cybsi.cloud.error import CybsiError
+from cybsi.cloud.internal import HTTPConnector, JsonObjectForm
+from tests import BaseTest
+
+
+class HTTPConnectorCacheTest(BaseTest):
+    def setUp(self) -> None:
+        self.connector = HTTPConnector(
+            base_url="http://localhost",
+            auth=None,
+            ssl_verify=True,
+            timeouts=_DEFAULT_TIMEOUTS,
+            limits=_DEFAULT_LIMITS,
+            retry=_DEFAULT_RETRY_COUNT,
+            cache_enabled=True,
+        )
+
+    @patch.object(httpx.Client, "send")
+    def test_get_is_cached(self, mock):
+        mock.return_value = self._make_response(200, [{"id": 1}])
+
+        first = self.connector.do_get("/test", params={"limit": 1}, cache_ttl=60)
+        second = self.connector.do_get("/test", params={"limit": 1}, cache_ttl=60)
+        assert first is second
+        assert mock.call_count == 1
+
+        self.connector.do_get("/test", params={"limit": 2}, cache_ttl=60)
+        assert mock.call_count == 2
+
+    @patch.object(httpx.Client, "send")
+    def test_get_without_ttl_is_not_cached(self, mock):
+        mock.return_value = self._make_response(200, [])
+
+        self.connector.do_get("/test")
+        self.connector.do_get("/test")
+        assert mock.call_count == 2
+
+    @patch.object(httpx.Client, "send")
+    def test_modifying_request_invalidates_cache(self, mock):
+        mock.return_value = self._make_response(200, [])
+
+        self.connector.do_get("/test", cache_ttl=60)
+        self.connector.do_post("/test", json={})
+        self.connector.do_get("/test", cache_ttl=60)
+        assert mock.call_count == 3
+
+    @patch.object(httpx.Client, "send")
+    def test_expired_response_is_not_served_by_default(self, mock):
+        mock.side_effect = [
+            self._make_response(200, []),
+            self._make_response(503, {}),
+        ]
+
+        self.connector.do_get("/test", cache_ttl=0)
+        with self.assertRaises(CybsiError):
+            self.connector.do_get("/test", cache_ttl=0)
+
+    @patch.object(httpx.Client, "send")
+    def test_expired_response_is_served_on_server_error(self, mock):
+        self.connector = HTTPConnector(
+            base_url="http://localhost",
+            auth=None,
+            ssl_verify=True,
+            timeouts=_DEFAULT_TIMEOUTS,
+            limits=_DEFAULT_LIMITS,
+            retry=_DEFAULT_RETRY_COUNT,
+            cache_enabled=True,
+            cache_stale_on_error=True,
+        )
+        cached = self._make_response(200, [])
+        unavailable = self._make_response(503, {})
+        mock.side_effect = [cached, unavailable, cached, unavailable]
+
+        self.connector.do_get("/test", cache_ttl=0)
+        assert self.connector.do_get("/test", cache_ttl=0) is cached
+
+        self.connector.do_post("/test", json={})
+        with self.assertRaises(CybsiError):
+            self.connector.do_get("/test", cache_ttl=0)
+
+
+class HTTPConnectorJsonTest(BaseTest):
+    def setUp(self) -> None:
+        self.connector = HTTPConnector(
+            base_url="http://localhost",
+            auth=None,
+            ssl_verify=True,
+            timeouts=_DEFAULT_TIMEOUTS,
+            limits=_DEFAULT_LIMITS,
+            retry=_DEFAULT_RETRY_COUNT,
+        )
+
+    @patch.object(httpx.Client, "send")
+    def test_json_body(self, mock):
+        mock.return_value = self._make_response(200, {})
+        payload = {"name": "тест", "keys": [1, 2]}
+
+        self.connector.do_patch("/test", tag="1", json=payload)
+        req = mock.call_args.kwargs["request"]
+        assert req.headers["Content-Type"] == "application/json"
+        assert req.headers["If-Match"] == "1"
+        assert json_loads(req.content) == payload
+
+    @patch.object(httpx.Client, "send")
+    def test_serialized_form(self, mock):
+        mock.return_value = self._make_response(200, {})
+        form = JsonObjectForm({"name": "test"})
+
+        self.connector.do_post(
+            "/test",
+            content=form.serialized_json(),
+            headers={"Content-Type": "application/json"},
+        )
+        req = mock.call_args.kwargs["request"]
+        assert req.headers["Content-Type"] == "application/json"
+        # The encoded document is kept by the form.
+        assert req.content is form.serialized_json()
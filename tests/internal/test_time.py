@@ -0,0 +1,23 @@
+import datetime
+import unittest
+
+from cybsi.cloud.internal.time import (
+    _strptime_rfc3339_timestamp,
+    parse_rfc3339_timestamp,
+)
+
+
+class ParseRFC3339TimestampTest(unittest.TestCase):
+    def test_parse_timestamp(self):
+        for ts in ("2023-12-07T05:11:03Z", "2023-12-07T05:11:03.024Z"):
+            actual = parse_rfc3339_timestamp(ts)
+            assert actual == _strptime_rfc3339_timestamp(ts)
+            assert actual.tzinfo is None
+
+    def test_parse_timestamp_with_microseconds(self):
+        actual = parse_rfc3339_timestamp("2023-12-07T05:11:03.000001Z")
+        assert actual == datetime.datetime(2023, 12, 7, 5, 11, 3, 1)
+
+    def test_parse_invalid_timestamp(self):
+        with self.assertRaises(ValueError):
+            parse_rfc3339_timestamp("2023-12-07T05:11:03+03:00")
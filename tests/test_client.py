@@ -0,0 +1,90 @@
+import asyncio
+import time
+import unittest
+
+from cybsi.cloud import AsyncClient, Client, Config
+from cybsi.cloud.client import _shared_connectors
+
+
+class SharedPoolTest(unittest.TestCase):
+    def tearDown(self) -> None:
+        Client.close_shared_pools()
+
+    def test_clients_share_connector(self):
+        config = Config(api_key="key", api_url="http://localhost")
+        other_config = Config(api_key="key", api_url="http://localhost")
+
+        client = Client.shared_pool(config)
+        with Client.shared_pool(other_config) as other:
+            assert other._connector is client._connector
+            assert Client(config)._connector is not client._connector
+
+        # closing a client doesn't release connector of another client.
+        assert not client._connector._client.is_closed
+        client.close()
+
+    def test_sequential_clients_share_connector(self):
+        config = Config(api_key="key", api_url="http://localhost")
+        with Client.shared_pool(config) as client:
+            connector = client._connector
+        with Client.shared_pool(config) as client:
+            assert client._connector is connector
+        assert not connector._client.is_closed
+
+        Client.close_shared_pools()
+        assert connector._client.is_closed
+        assert not _shared_connectors
+
+    def test_different_configs(self):
+        client = Client.shared_pool(Config(api_key="key1"))
+        other = Client.shared_pool(Config(api_key="key2"))
+        assert other._connector is not client._connector
+        client.close()
+        other.close()
+
+
+class BatchTest(unittest.TestCase):
+    def test_batch(self):
+        with Client(Config(api_key="key")) as client:
+            results = client.batch(lambda i=i: i * 2 for i in range(5))
+        assert results == [0, 2, 4, 6, 8]
+
+    def test_batch_error_cancels_queued_calls(self):
+        calls = []
+
+        def call(i):
+            calls.append(i)
+            if i == 0:
+                raise ValueError(i)
+            time.sleep(0.01)
+
+        with Client(Config(api_key="key")) as client:
+            with self.assertRaises(ValueError):
+                client.batch((lambda i=i: call(i) for i in range(20)), max_workers=1)
+        assert calls == [0]
+
+
+class AsyncBatchTest(unittest.IsolatedAsyncioTestCase):
+    async def test_batch(self):
+        async def call(i):
+            await asyncio.sleep(0.01 * (5 - i))
+            return i
+
+        async with AsyncClient(Config(api_key="key")) as client:
+            results = await client.batch(call(i) for i in range(5))
+        assert results == [0, 1, 2, 3, 4]
+
+    async def test_batch_error_cancels_calls(self):
+        completed = []
+
+        async def call(i):
+            if i == 0:
+                raise ValueError(i)
+            await asyncio.sleep(0.01)
+            completed.append(i)
+
+        async with AsyncClient(Config(api_key="key")) as client:
+            with self.assertRaises(ValueError):
+                await client.batch(call(i) for i in range(5))
+            await asyncio.sleep(0.02)
+        assert completed == []
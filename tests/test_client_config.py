@@ -0,0 +1,38 @@
+import unittest
+
+from cybsi.cloud import Timeouts
+from cybsi.cloud.client_config import _DEFAULT_LIMITS, _DEFAULT_TIMEOUTS
+
+
+class TimeoutsTest(unittest.TestCase):
+    def test_default(self):
+        t = Timeouts(default=5.0, connect=10.0)
+        assert (t.connect, t.read, t.write) == (10.0, 5.0, 5.0)
+
+    def test_no_timeouts(self):
+        t = Timeouts(default=None, connect=5.0)
+        assert (t.connect, t.read, t.write) == (5.0, None, None)
+
+    def test_explicit(self):
+        t = Timeouts(connect=1.0, read=2.0, write=None)
+        assert (t.connect, t.read, t.write) == (1.0, 2.0, None)
+
+    def test_copy(self):
+        t = Timeouts(default=Timeouts(default=3.0, read=None))
+        assert (t.connect, t.read, t.write) == (3.0, None, 3.0)
+
+    def test_missing_default(self):
+        with self.assertRaises(ValueError):
+            Timeouts(connect=1.0, read=2.0)
+
+
+class DefaultsTest(unittest.TestCase):
+    def test_default_httpx_settings_are_shared(self):
+        assert _DEFAULT_TIMEOUTS._as_httpx_timeouts() is (
+            _DEFAULT_TIMEOUTS._as_httpx_timeouts()
+        )
+        assert _DEFAULT_LIMITS._as_httpx_limits() is _DEFAULT_LIMITS._as_httpx_limits()
+
+    def test_custom_httpx_settings(self):
+        timeout = Timeouts(default=5.0)._as_httpx_timeouts()
+        assert (timeout.connect, timeout.read, timeout.write) == (5.0, 5.0, 5.0)
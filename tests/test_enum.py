@@ -0,0 +1,31 @@
+import unittest
+
+from cybsi.cloud.enum import CybsiAPIEnum
+
+
+class Color(CybsiAPIEnum):
+    Red = "Red"
+    DarkBlue = "DarkBlue"
+
+
+class Shape(CybsiAPIEnum):
+    Red = "red"
+
+
+class EnumTest(unittest.TestCase):
+    def test_from_string(self):
+        assert Color.from_string("Red") is Color.Red
+        assert Shape.from_string("red") is Shape.Red
+
+    def test_from_string_ignore_case(self):
+        assert Color.from_string("darkblue", ignore_case=True) is Color.DarkBlue
+        assert Shape.from_string("RED", ignore_case=True) is Shape.Red
+
+    def test_from_string_unknown_value(self):
+        with self.assertRaises(ValueError):
+            Color.from_string("darkblue")
+        with self.assertRaises(ValueError):
+            Color.from_string("Green", ignore_case=True)
+
+    def test_value_copy(self):
+        assert all(member._v is member.value for member in Color)
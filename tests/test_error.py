@@ -0,0 +1,88 @@
+from unittest.mock import patch
+
+import httpx
+
+from cybsi.cloud.error import (
+    CybsiError,
+    ForbiddenError,
+    ForbiddenErrorCodes,
+    NotFoundError,
+    RangeNotSatisfiableError,
+    ResourceModifiedError,
+    SchemaCheckErrorDetails,
+    SemanticError,
+    UnauthorizedError,
+    _raise_cybsi_error,
+)
+from tests import BaseTest
+
+
+class ErrorTest(BaseTest):
+    def test_api_error_message(self):
+        resp = self._make_response(
+            403, {"code": "MissingPermissions", "message": "no access"}
+        )
+        with self.assertRaises(ForbiddenError) as ctx:
+            _raise_cybsi_error(resp)
+
+        assert ctx.exception.code == ForbiddenErrorCodes.MissingPermissions
+        assert "code: MissingPermissions, message: no access" in str(ctx.exception)
+
+    def test_body_is_not_parsed_if_not_needed(self):
+        resp = self._make_response(412, {"code": "ResourceModified"})
+        with patch.object(httpx.Response, "json") as json_mock:
+            with self.assertRaises(ResourceModifiedError) as ctx:
+                _raise_cybsi_error(resp)
+            json_mock.assert_not_called()
+
+        assert ctx.exception.content.code == "ResourceModified"
+
+    def test_not_found(self):
+        with self.assertRaises(NotFoundError) as ctx:
+            _raise_cybsi_error(httpx.Response(404, text="not found"))
+
+        assert ctx.exception.content.code is None
+
+    def test_range_not_satisfiable(self):
+        with self.assertRaises(RangeNotSatisfiableError) as ctx:
+            _raise_cybsi_error(httpx.Response(416))
+
+        assert ctx.exception.content.code is None
+
+    def test_schema_check_error_details(self):
+        resp = self._make_response(
+            422,
+            {
+                "code": "SchemaCheckFail",
+                "message": "invalid object",
+                "details": {
+                    "AbsoluteKeywordLocation": "#/required",
+                    "InstanceLocation": "/",
+                    "Message": "missing properties",
+                },
+            },
+        )
+        with self.assertRaises(SemanticError) as ctx:
+            _raise_cybsi_error(resp)
+
+        details = SchemaCheckErrorDetails(ctx.exception.content.details)
+        assert details.absolute_keyword_location == "#/required"
+        assert details.instance_location == "/"
+        assert details.message == "missing properties"
+
+    def test_empty_body(self):
+        with self.assertRaises(UnauthorizedError) as ctx:
+            _raise_cybsi_error(httpx.Response(401))
+
+        assert ctx.exception.content.code is None
+
+    def test_unexpected_status_body_is_truncated(self):
+        with self.assertRaises(CybsiError) as ctx:
+            _raise_cybsi_error(httpx.Response(502, text="x" * 4096))
+
+        assert str(ctx.exception).endswith("Request body: " + "x" * 1024)
+
+    def test_success_response(self):
+        _raise_cybsi_error(self._make_response(200, {}))
+        with self.assertRaises(CybsiError):
+            _raise_cybsi_error(httpx.Response(302))
@@ -0,0 +1,42 @@
+import unittest
+from concurrent.futures import Future
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+from cybsi.cloud import pagination
+from cybsi.cloud.pagination import Page, chain_pages
+
+
+def _make_page_response(items: list, next_cursor=None) -> httpx.Response:
+    headers = {}
+    if next_cursor is not None:
+        headers["Link"] = f'<http://localhost/test?cursor={next_cursor}>; rel="next"'
+    return httpx.Response(200, json=items, headers=headers)
+
+
+class PageTest(unittest.TestCase):
+    def test_prefetch_next_page(self):
+        api_call = MagicMock(return_value=_make_page_response([2]))
+        page = Page(api_call, _make_page_response([1], "2"), int, prefetch=True)
+        page._next.result()  # type: ignore
+        api_call.assert_called_once_with("http://localhost/test?cursor=2")
+
+        assert list(chain_pages(page)) == [1, 2]
+        assert api_call.call_count == 1
+
+    @patch.object(pagination, "_submit_prefetch", side_effect=lambda fn, link: Future())
+    def test_prefetch_is_cancelled_on_early_stop(self, _):
+        page = Page(MagicMock(), _make_page_response([1], "2"), int, prefetch=True)
+
+        pages = chain_pages(page)
+        assert next(pages) == 1
+        pages.close()
+        assert page._next.cancelled()  # type: ignore
+
+    def test_no_prefetch_on_last_page(self):
+        api_call = MagicMock()
+        page = Page(api_call, _make_page_response([1]), int, prefetch=True)
+
+        assert page.next_page() is None
+        api_call.assert_not_called()